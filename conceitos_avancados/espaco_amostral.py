@@ -0,0 +1,387 @@
+"""
+Espaço Amostral Vetorizado
+Representa espaços amostrais finitos como colunas NumPy e eventos como máscaras booleanas
+
+Desenvolvido por: Thiago Rodrigues Pantoja
+Empresa: EasyNext Informática LTDA
+Emails: thiago.pantoja@easynext.tech | thiago.pantoja@easynext.consulting
+Telefones: (11) 98801-0667 | (92) 98456-1928
+Data: Setembro 2025
+"""
+
+from itertools import chain, combinations_with_replacement, islice
+from math import comb, factorial, prod
+import numpy as np
+import pandas as pd
+
+# Valores de dados em int64: diferenças, somas e produtos de colunas (d1 * d2 * ...)
+# não estouram em casos práticos, como estourariam em tipos menores
+_TIPO_FACES = np.int64
+
+def _coluna(valores):
+    """
+    Converte os valores de uma coluna em array 1-D
+    
+    Se os tipos Python diferem (ex.: 'A' e 2, ou None e 'x'), ou se os
+    valores não são texto mas o NumPy os converteria em texto, a coluna
+    fica com dtype=object, preservando os valores originais; assim c == 2
+    continua comparando com o número 2, e não com a string '2'.
+    """
+    valores = list(valores)
+    tipos = {type(valor) for valor in valores}
+    if len(tipos) == 1 and not tipos <= {tuple, list}:
+        coluna = np.array(valores)
+        if coluna.ndim == 1 and (coluna.dtype.kind not in 'US' or tipos <= {str, bytes}):
+            return coluna
+    return np.fromiter(valores, dtype=object, count=len(valores))
+
+class EspacoAmostral:
+    """
+    Espaço amostral finito guardado em colunas NumPy
+    
+    Cada resultado é uma linha. As colunas podem ser acessadas pelo nome
+    (espaco.d1) ou pela posição (espaco[0]), então um evento escrito para
+    uma tupla, como lambda r: r[0] + r[1] == 7, também pode ser avaliado
+    sobre o espaço inteiro de uma vez, devolvendo uma máscara booleana.
+    
+    pesos: peso (probabilidade relativa) de cada resultado; None indica
+    resultados equiprováveis.
+    
+    escalar=True marca um espaço de valores simples (uma única coluna): os
+    eventos recebem a coluna inteira ou, no modo resultado a resultado,
+    o próprio valor em vez de uma tupla de um elemento.
+    """
+    
+    def __init__(self, colunas, pesos=None, escalar=False):
+        self.colunas = {nome: np.asarray(valores) for nome, valores in colunas.items()}
+        self.nomes = list(self.colunas)
+        self.pesos = None if pesos is None else np.asarray(pesos, dtype=np.float64)
+        self.escalar = escalar
+        self._tipo_linha = tuple
+        self._vetorizavel = True
+        if escalar and len(self.colunas) != 1:
+            raise ValueError("Um espaço escalar deve ter exatamente uma coluna")
+        
+        tamanhos = {len(valores) for valores in self.colunas.values()}
+        if self.pesos is not None:
+            tamanhos.add(len(self.pesos))
+        if len(tamanhos) > 1:
+            raise ValueError("Todas as colunas (e os pesos) devem ter o mesmo tamanho")
+    
+    @classmethod
+    def dados(cls, n_dados=2, faces=6):
+        """
+        Espaço de n_dados dados de faces lados, com colunas d1, d2, ...
+        """
+        valores = np.indices((faces,) * n_dados, dtype=_TIPO_FACES)
+        valores = valores.reshape(n_dados, -1) + 1
+        return cls({f'd{i + 1}': valores[i] for i in range(n_dados)})
+    
+    @classmethod
+    def de_lista(cls, resultados):
+        """
+        Converte uma lista de tuplas (ou listas) em espaço com colunas x1, x2, ...
+        
+        Resultados que não são tuplas nem listas do mesmo tamanho viram um
+        espaço escalar de uma coluna x1 com os próprios valores.
+        """
+        resultados = list(resultados)
+        if not resultados:
+            return cls({})
+        
+        tipos = {type(resultado) for resultado in resultados}
+        if len(tipos) == 1 and tipos <= {tuple, list} and len({len(r) for r in resultados}) == 1:
+            espaco = cls({f'x{i + 1}': _coluna(coluna)
+                          for i, coluna in enumerate(zip(*resultados))})
+            espaco._tipo_linha = tipos.pop()
+            return espaco
+        
+        espaco = cls({'x1': _coluna(resultados)}, escalar=True)
+        # Com tuplas e listas como valores, operações na coluna (c == (1, 2))
+        # seriam difundidas elemento a elemento: avalia resultado a resultado
+        espaco._vetorizavel = not tipos & {tuple, list}
+        return espaco
+    
+    def __len__(self):
+        if not self.colunas:
+            return 0
+        return len(next(iter(self.colunas.values())))
+    
+    def __getattr__(self, nome):
+        if nome.startswith('_') or nome in ('colunas', 'nomes', 'pesos', 'escalar'):
+            raise AttributeError(nome)
+        try:
+            return self.colunas[nome]
+        except KeyError:
+            raise AttributeError(f"O espaço amostral não tem a coluna '{nome}'") from None
+    
+    def __getitem__(self, chave):
+        if isinstance(chave, str):
+            return self.colunas[chave]
+        return self.colunas[self.nomes[chave]]
+    
+    def blocos(self):
+        """
+        Itera o espaço em blocos; um espaço materializado é um único bloco
+        """
+        yield self
+    
+    def linhas(self):
+        """
+        Itera os resultados como tuplas (ou listas, se vieram assim de de_lista)
+        de valores Python; num espaço escalar, os próprios valores
+        """
+        if self.escalar:
+            return iter(self.colunas[self.nomes[0]].tolist())
+        linhas = zip(*(valores.tolist() for valores in self.colunas.values()))
+        return linhas if self._tipo_linha is tuple else map(self._tipo_linha, linhas)
+    
+    def avaliar(self, evento):
+        """
+        Avalia o evento em todos os resultados e devolve uma máscara booleana
+        
+        Primeiro o evento é chamado com o espaço inteiro (ou com a coluna,
+        num espaço escalar), no caso vetorizado; se ele não devolver um
+        array booleano por resultado, por exemplo porque usa `in`, compara
+        tuplas ou chama métodos de tupla, é avaliado resultado a resultado.
+        """
+        argumento = self.colunas[self.nomes[0]] if self.escalar else self
+        mascara = None
+        if self._vetorizavel:
+            try:
+                mascara = evento(argumento)
+            except (TypeError, ValueError, AttributeError):
+                # Predicados escalares falham com arrays (ex.: `array in lista`, r.count(6))
+                pass
+        
+        if isinstance(mascara, np.ndarray) and mascara.shape == (len(self),):
+            return mascara.astype(bool, copy=False)
+        
+        return np.fromiter((bool(evento(resultado)) for resultado in self.linhas()),
+                           dtype=bool, count=len(self))
+    
+    def medida(self, mascara=None):
+        """
+        Peso total dos resultados selecionados pela máscara (todos, se None)
+        """
+        if self.pesos is None:
+            return len(self) if mascara is None else int(np.count_nonzero(mascara))
+        if mascara is None:
+            return float(self.pesos.sum())
+        return float(self.pesos[mascara].sum())
+
+class EspacoProduto:
+    """
+    Produto cartesiano de dados percorrido em blocos, sem materializar o espaço
+    
+    faces pode ser um inteiro (n_dados dados iguais) ou uma sequência com o
+    número de faces de cada dado. Os resultados seguem a ordem lexicográfica
+    de [(i, j) for i in ... for j in ...] e cada bloco é um EspacoAmostral
+    com colunas d1, d2, ... de até tamanho_bloco resultados.
+    
+    Os últimos dados, cujo produto cabe num bloco, são enumerados uma única
+    vez; para cada bloco só as colunas dos primeiros dados são recalculadas.
+    A memória usada é fixa, qualquer que seja o tamanho do espaço.
+    
+    simetrico=True (dados iguais) enumera multiconjuntos em vez de tuplas
+    ordenadas: cada resultado é uma tupla não decrescente d1 <= d2 <= ...
+    com peso multinomial n!/(c1!...cf!), o número de tuplas ordenadas que
+    ela representa. Só vale para eventos que dependem dos valores e não da
+    ordem dos dados (somas, quantidade de seis, "todos distintos"); com
+    15 dados são 15.504 multiconjuntos em vez de 4,7e11 tuplas.
+    """
+    
+    def __init__(self, faces=6, n_dados=2, tamanho_bloco=1 << 16, simetrico=False):
+        if isinstance(faces, int):
+            faces = (faces,) * n_dados
+        self.faces = tuple(int(f) for f in faces)
+        if not self.faces or min(self.faces) < 1:
+            raise ValueError("É preciso pelo menos um dado, com pelo menos uma face")
+        if tamanho_bloco < 1:
+            raise ValueError("O tamanho do bloco deve ser positivo")
+        if simetrico and len(set(self.faces)) > 1:
+            raise ValueError("A enumeração simétrica exige dados com o mesmo número de faces")
+        
+        self.n_dados = len(self.faces)
+        self.tamanho_bloco = tamanho_bloco
+        self.simetrico = simetrico
+        self.nomes = [f'd{i + 1}' for i in range(self.n_dados)]
+        self.pesos = None
+    
+    def __len__(self):
+        """
+        Número de resultados enumerados (multiconjuntos, se simetrico=True)
+        """
+        if self.simetrico:
+            return comb(self.faces[0] + self.n_dados - 1, self.n_dados)
+        return prod(self.faces)
+    
+    def blocos(self):
+        """
+        Gera os blocos do espaço como EspacoAmostral
+        """
+        if self.simetrico:
+            return self._blocos_multiconjuntos()
+        return self._blocos_ordenados()
+    
+    def _blocos_multiconjuntos(self):
+        """
+        Multiconjuntos em ordem lexicográfica, com pesos multinomiais
+        """
+        tipo = _TIPO_FACES
+        faces, n = self.faces[0], self.n_dados
+        fatoriais = np.array([factorial(c) for c in range(n + 1)], dtype=np.float64)
+        
+        multiconjuntos = combinations_with_replacement(range(1, faces + 1), n)
+        while True:
+            bloco = list(islice(multiconjuntos, self.tamanho_bloco))
+            if not bloco:
+                break
+            
+            valores = np.fromiter(chain.from_iterable(bloco), dtype=tipo,
+                                  count=len(bloco) * n).reshape(len(bloco), n)
+            
+            # Peso = n! / produto dos fatoriais das contagens de cada face
+            denominador = np.ones(len(bloco), dtype=np.float64)
+            for face in range(1, faces + 1):
+                denominador *= fatoriais[np.count_nonzero(valores == face, axis=1)]
+            
+            colunas = {nome: valores[:, i] for i, nome in enumerate(self.nomes)}
+            yield EspacoAmostral(colunas, pesos=factorial(n) / denominador)
+    
+    def _blocos_ordenados(self):
+        """
+        Tuplas ordenadas, com os dados internos enumerados uma única vez
+        """
+        tipo = _TIPO_FACES
+        
+        # Maior sufixo de dados cujo produto cabe num bloco
+        n_internos = 0
+        tamanho_interno = 1
+        while (n_internos < self.n_dados
+               and tamanho_interno * self.faces[-1 - n_internos] <= self.tamanho_bloco):
+            tamanho_interno *= self.faces[-1 - n_internos]
+            n_internos += 1
+        
+        n_externos = self.n_dados - n_internos
+        faces_externas = self.faces[:n_externos]
+        # Não repete os dados internos além do número de combinações externas
+        grupos = max(1, min(self.tamanho_bloco // tamanho_interno, prod(faces_externas)))
+        
+        # Colunas dos dados internos, repetidas para os grupos de um bloco
+        if n_internos > 0:
+            internos = np.indices(self.faces[n_externos:], dtype=tipo).reshape(n_internos, -1) + 1
+            internos = np.tile(internos, grupos)
+        else:
+            internos = np.empty((0, grupos), dtype=tipo)
+        internos.flags.writeable = False
+        
+        for inicio in range(0, prod(faces_externas), grupos):
+            fim = min(inicio + grupos, prod(faces_externas))
+            tamanho = (fim - inicio) * tamanho_interno
+            
+            colunas = {}
+            indices = np.arange(inicio, fim, dtype=np.int64)
+            for i in range(n_externos - 1, -1, -1):
+                indices, valor = np.divmod(indices, faces_externas[i])
+                colunas[self.nomes[i]] = np.repeat((valor + 1).astype(tipo), tamanho_interno)
+            
+            colunas = {nome: colunas[nome] for nome in self.nomes[:n_externos]}
+            for i in range(n_internos):
+                colunas[self.nomes[n_externos + i]] = internos[i, :tamanho]
+            
+            yield EspacoAmostral(colunas)
+
+class AmostraDados:
+    """
+    Amostra de lançamentos de dados honestos, sorteada bloco a bloco
+    
+    Cada bloco é um EspacoAmostral com colunas d1, d2, ... e até
+    tamanho_bloco lançamentos; a amostra inteira nunca fica em memória,
+    então pode ser usada no lugar de um espaço amostral para estimar
+    probabilidades por Monte Carlo.
+    """
+    
+    def __init__(self, n_amostras, faces=6, n_dados=2, tamanho_bloco=1 << 20, rng=None):
+        if n_amostras < 1:
+            raise ValueError("A amostra deve ter pelo menos um lançamento")
+        if tamanho_bloco < 1:
+            raise ValueError("O tamanho do bloco deve ser positivo")
+        
+        self.n_amostras = n_amostras
+        self.faces = faces
+        self.n_dados = n_dados
+        self.tamanho_bloco = tamanho_bloco
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.nomes = [f'd{i + 1}' for i in range(n_dados)]
+        self.pesos = None
+    
+    def __len__(self):
+        return self.n_amostras
+    
+    def blocos(self):
+        """
+        Sorteia e gera os blocos da amostra
+        """
+        tipo = _TIPO_FACES
+        for inicio in range(0, self.n_amostras, self.tamanho_bloco):
+            tamanho = min(self.tamanho_bloco, self.n_amostras - inicio)
+            valores = self.rng.integers(1, self.faces + 1, size=(self.n_dados, tamanho), dtype=tipo)
+            yield EspacoAmostral(dict(zip(self.nomes, valores)))
+
+def como_espaco(espaco_amostral):
+    """
+    Aceita um EspacoAmostral, um EspacoProduto, uma AmostraDados ou uma lista de resultados
+    """
+    if isinstance(espaco_amostral, (EspacoAmostral, EspacoProduto, AmostraDados)):
+        return espaco_amostral
+    return EspacoAmostral.de_lista(espaco_amostral)
+
+def medir_par_eventos(espaco_amostral, evento_a, evento_b):
+    """
+    Acumula, bloco a bloco, os pesos do espaço, de A, de B e de A ∩ B
+    
+    Cada evento é avaliado uma única vez por bloco.
+    """
+    total = medida_a = medida_b = medida_a_e_b = 0
+    for bloco in como_espaco(espaco_amostral).blocos():
+        mascara_a = bloco.avaliar(evento_a)
+        mascara_b = bloco.avaliar(evento_b)
+        
+        total += bloco.medida()
+        medida_a += bloco.medida(mascara_a)
+        medida_b += bloco.medida(mascara_b)
+        medida_a_e_b += bloco.medida(mascara_a & mascara_b)
+    
+    return total, medida_a, medida_b, medida_a_e_b
+
+def codificar_categorias(valores, codigos, categorias, ausente=None, ordenar=False):
+    """
+    Converte valores categóricos em códigos inteiros 0..K-1
+    
+    codigos (valor -> código) e categorias (código -> valor) são estendidos
+    com os valores novos, então chamadas sucessivas com os mesmos objetos
+    dão códigos estáveis entre blocos. pd.factorize não precisa ordenar os
+    valores e aceita tipos misturados (texto e NaN, por exemplo); valores
+    ausentes (None, NaN) formam a categoria ausente. ordenar=True ordena
+    as categorias novas quando os tipos permitem.
+    """
+    if isinstance(valores, np.ndarray):
+        valores = valores.ravel()
+    serie = pd.Series(valores)
+    try:
+        locais, unicos = pd.factorize(serie, sort=ordenar)
+    except TypeError:
+        locais, unicos = pd.factorize(serie)
+    
+    valores_unicos = unicos.tolist()
+    if np.any(locais < 0):
+        # Último elemento do mapa: o código -1 (ausente) indexa a última posição
+        valores_unicos.append(ausente)
+    
+    for valor in valores_unicos:
+        if valor not in codigos:
+            codigos[valor] = len(codigos)
+            categorias.append(valor)
+    mapa = np.array([codigos[valor] for valor in valores_unicos], dtype=np.int64)
+    return mapa[locais]
@@ -9,34 +9,52 @@ Telefones: (11) 98801-0667 | (92) 98456-1928
 Data: Setembro 2025
 """
 
+import os
+import sys
 import random
 import matplotlib.pyplot as plt
 from collections import Counter
+from itertools import combinations
 import numpy as np
+import pandas as pd
+from scipy import stats
+
+# Permite importar os módulos do repositório também ao executar este arquivo diretamente
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conceitos_avancados.espaco_amostral import (AmostraDados, EspacoProduto, codificar_categorias,
+                                                 como_espaco, medir_par_eventos)
+from exemplos_basicos.baralho import contar_bits
+
+def _compactar_mascara(mascara):
+    """
+    Compacta uma máscara booleana em palavras uint64 (bits de preenchimento zerados)
+    """
+    bytes_mascara = np.packbits(mascara)
+    bytes_mascara = np.pad(bytes_mascara, (0, -len(bytes_mascara) % 8))
+    return bytes_mascara.view(np.uint64)
 
 class IndependenciaEventos:
     """
     Classe para demonstrar independência de eventos
+    
+    O espaço amostral pode ser uma lista de resultados, um EspacoAmostral
+    ou um EspacoProduto, percorrido em blocos com memória constante.
     """
     
-    def __init__(self):
-        pass
+    def __init__(self, semente=None):
+        self.rng = np.random.default_rng(semente)
     
     def verificar_independencia(self, evento_a, evento_b, espaco_amostral):
         """
         Verifica se dois eventos são independentes
         """
-        # P(A)
-        resultados_a = [x for x in espaco_amostral if evento_a(x)]
-        prob_a = len(resultados_a) / len(espaco_amostral)
-        
-        # P(B)
-        resultados_b = [x for x in espaco_amostral if evento_b(x)]
-        prob_b = len(resultados_b) / len(espaco_amostral)
+        total, medida_a, medida_b, medida_a_e_b = medir_par_eventos(
+            espaco_amostral, evento_a, evento_b)
         
-        # P(A ∩ B)
-        resultados_a_e_b = [x for x in espaco_amostral if evento_a(x) and evento_b(x)]
-        prob_a_e_b = len(resultados_a_e_b) / len(espaco_amostral)
+        prob_a = medida_a / total
+        prob_b = medida_b / total
+        prob_a_e_b = medida_a_e_b / total
         
         # P(A) * P(B)
         prob_independencia = prob_a * prob_b
@@ -53,30 +71,71 @@ class IndependenciaEventos:
             'diferenca': abs(prob_a_e_b - prob_independencia)
         }
     
-    def simular_independencia(self, evento_a, evento_b, n_simulacoes=10000):
+    def matriz_independencia(self, eventos, espaco_amostral, tolerancia=1e-10,
+                             tamanho_fatia=1 << 16):
         """
-        Simula independência usando Monte Carlo
+        Verifica a independência de todos os pares de uma lista de eventos
+        
+        Cada evento é avaliado uma única vez por bloco do espaço e guardado
+        como bitset compactado (palavras de 64 bits); o número de resultados
+        em Ai ∩ Aj é a contagem de bits de Ai & Aj, sem voltar às máscaras
+        booleanas. Em espaços com pesos (ex.: EspacoProduto simétrico) as
+        máscaras entram num produto matricial ponderado, fatia a fatia.
+        Com m eventos, a diagonal de prob_intersecao é P(Ai) e
+        prob_independencia[i, j] = P(Ai) * P(Aj).
         """
-        resultados_a = 0
-        resultados_b = 0
-        resultados_a_e_b = 0
+        espaco = como_espaco(espaco_amostral)
+        m = len(eventos)
+        if m == 0:
+            raise ValueError("Informe pelo menos um evento")
         
-        for _ in range(n_simulacoes):
-            # Simula lançamento de dois dados
-            dado1 = random.randint(1, 6)
-            dado2 = random.randint(1, 6)
-            resultado = (dado1, dado2)
+        total = 0
+        contagens = np.zeros((m, m), dtype=np.int64)
+        intersecoes = np.zeros((m, m), dtype=np.float64)
+        
+        for bloco in espaco.blocos():
+            total += bloco.medida()
+            if bloco.pesos is None:
+                bitset = np.stack([_compactar_mascara(bloco.avaliar(evento)) for evento in eventos])
+                # Só o triângulo superior; a matriz é simétrica
+                for i in range(m):
+                    contagens[i, i:] += contar_bits(bitset[i] & bitset[i:]).sum(axis=1)
+                continue
             
-            if evento_a(resultado):
-                resultados_a += 1
-            if evento_b(resultado):
-                resultados_b += 1
-            if evento_a(resultado) and evento_b(resultado):
-                resultados_a_e_b += 1
+            mascaras = np.stack([bloco.avaliar(evento) for evento in eventos])
+            for inicio in range(0, len(bloco), tamanho_fatia):
+                fatia = mascaras[:, inicio:inicio + tamanho_fatia].astype(np.float64)
+                intersecoes += (fatia * bloco.pesos[inicio:inicio + tamanho_fatia]) @ fatia.T
+        
+        intersecoes += contagens + np.triu(contagens, 1).T
+        prob_intersecao = intersecoes / total
+        prob = np.diag(prob_intersecao).copy()
+        prob_independencia = np.outer(prob, prob)
+        diferenca = np.abs(prob_intersecao - prob_independencia)
+        
+        return {
+            'prob': prob,
+            'prob_intersecao': prob_intersecao,
+            'prob_independencia': prob_independencia,
+            'independencia': diferenca < tolerancia,
+            'diferenca': diferenca
+        }
+    
+    def simular_independencia(self, evento_a, evento_b, n_simulacoes=10000,
+                              n_dados=2, faces=6, tamanho_bloco=1 << 20):
+        """
+        Simula independência usando Monte Carlo
+        
+        Os dados são sorteados em blocos de até tamanho_bloco lançamentos e
+        cada evento é avaliado uma única vez por bloco, como máscara
+        (predicados escalares são avaliados lançamento a lançamento).
+        """
+        amostra = AmostraDados(n_simulacoes, faces, n_dados, tamanho_bloco, self.rng)
+        total, medida_a, medida_b, medida_a_e_b = medir_par_eventos(amostra, evento_a, evento_b)
         
-        prob_a = resultados_a / n_simulacoes
-        prob_b = resultados_b / n_simulacoes
-        prob_a_e_b = resultados_a_e_b / n_simulacoes
+        prob_a = medida_a / total
+        prob_b = medida_b / total
+        prob_a_e_b = medida_a_e_b / total
         prob_independencia = prob_a * prob_b
         
         return {
@@ -87,6 +146,133 @@ class IndependenciaEventos:
             'diferenca': abs(prob_a_e_b - prob_independencia)
         }
 
+class AcumuladorContingencia:
+    """
+    Tabelas de contingência de todos os pares de colunas categóricas, acumuladas em blocos
+    
+    Os dados chegam em blocos (dicionário de arrays, DataFrame do pandas,
+    array 2D do NumPy ou arquivo CSV lido em partes) e só as contagens
+    ficam em memória: cada coluna tem um dicionário valor -> código e cada
+    par de colunas uma tabela atualizada com np.bincount. Ao final,
+    testar() aplica o teste qui-quadrado e calcula a informação mútua de
+    todos os pares.
+    
+    Valores ausentes (None, NaN) formam a categoria AUSENTE da coluna, que
+    entra nas tabelas e nos testes como qualquer outra.
+    """
+    
+    AUSENTE = None
+    
+    def __init__(self, colunas=None):
+        self.colunas = None if colunas is None else list(colunas)
+        self.n_linhas = 0
+        self.categorias = {}
+        self._codigos = {}
+        self._tabelas = {}
+    
+    def _codificar(self, coluna, valores):
+        """
+        Converte os valores de uma coluna em códigos inteiros estáveis entre blocos
+        """
+        return codificar_categorias(valores, self._codigos[coluna], self.categorias[coluna],
+                                    self.AUSENTE)
+    
+    def atualizar(self, dados):
+        """
+        Acrescenta um bloco de linhas (dicionário, DataFrame ou array 2D)
+        """
+        if isinstance(dados, np.ndarray):
+            if dados.ndim != 2:
+                raise ValueError("Arrays devem ser 2D (linhas x colunas)")
+            nomes = self.colunas or [f'c{i}' for i in range(dados.shape[1])]
+            if len(nomes) != dados.shape[1]:
+                raise ValueError(f"Esperadas {len(nomes)} colunas, recebidas {dados.shape[1]}")
+            dados = {nome: dados[:, i] for i, nome in enumerate(nomes)}
+        
+        if self.colunas is None:
+            self.colunas = list(dados.keys())
+        if len(self.colunas) < 2:
+            raise ValueError("São necessárias pelo menos duas colunas")
+        for coluna in self.colunas:
+            self.categorias.setdefault(coluna, [])
+            self._codigos.setdefault(coluna, {})
+        
+        codigos = {coluna: self._codificar(coluna, dados[coluna]) for coluna in self.colunas}
+        tamanhos = {len(c) for c in codigos.values()}
+        if len(tamanhos) > 1:
+            raise ValueError("Todas as colunas do bloco devem ter o mesmo tamanho")
+        
+        for coluna_i, coluna_j in combinations(self.colunas, 2):
+            k_i = len(self.categorias[coluna_i])
+            k_j = len(self.categorias[coluna_j])
+            contagens = np.bincount(codigos[coluna_i] * k_j + codigos[coluna_j],
+                                    minlength=k_i * k_j).reshape(k_i, k_j)
+            
+            # Categorias novas aumentam a tabela acumulada
+            tabela = self._tabelas.get((coluna_i, coluna_j))
+            if tabela is not None and tabela.shape != contagens.shape:
+                contagens[:tabela.shape[0], :tabela.shape[1]] += tabela
+            elif tabela is not None:
+                contagens += tabela
+            self._tabelas[(coluna_i, coluna_j)] = contagens
+        
+        self.n_linhas += tamanhos.pop()
+    
+    def atualizar_csv(self, caminho, tamanho_bloco=1_000_000, **opcoes):
+        """
+        Lê um CSV em blocos de tamanho_bloco linhas (opções repassadas ao pandas.read_csv)
+        """
+        if self.colunas is not None:
+            opcoes.setdefault('usecols', self.colunas)
+        for bloco in pd.read_csv(caminho, chunksize=tamanho_bloco, **opcoes):
+            self.atualizar(bloco)
+    
+    def tabela(self, coluna_i, coluna_j):
+        """
+        Tabela de contingência acumulada entre duas colunas
+        """
+        if (coluna_i, coluna_j) in self._tabelas:
+            return self._tabelas[(coluna_i, coluna_j)].copy()
+        if (coluna_j, coluna_i) in self._tabelas:
+            return self._tabelas[(coluna_j, coluna_i)].T.copy()
+        raise ValueError(f"Par de colunas desconhecido: ({coluna_i}, {coluna_j})")
+    
+    @staticmethod
+    def testar_tabela(tabela):
+        """
+        Teste qui-quadrado de independência e informação mútua (em bits) de uma tabela
+        """
+        tabela = np.asarray(tabela, dtype=np.float64)
+        # Categorias que nunca ocorreram não entram no teste
+        tabela = tabela[tabela.sum(axis=1) > 0][:, tabela.sum(axis=0) > 0]
+        n = tabela.sum()
+        
+        linhas = tabela.sum(axis=1, keepdims=True)
+        colunas = tabela.sum(axis=0, keepdims=True)
+        esperado = linhas * colunas / n
+        qui_quadrado = float(((tabela - esperado) ** 2 / esperado).sum())
+        graus_liberdade = (tabela.shape[0] - 1) * (tabela.shape[1] - 1)
+        
+        ocorridos = tabela > 0
+        informacao_mutua = float(np.sum(tabela[ocorridos] / n
+                                        * np.log2(tabela[ocorridos] / esperado[ocorridos])))
+        
+        return {
+            'qui_quadrado': qui_quadrado,
+            'graus_liberdade': graus_liberdade,
+            'p_valor': float(stats.chi2.sf(qui_quadrado, graus_liberdade)) if graus_liberdade else 1.0,
+            'informacao_mutua': max(informacao_mutua, 0.0)
+        }
+    
+    def testar(self):
+        """
+        Testa a independência de todos os pares de colunas
+        """
+        resultados = {}
+        for (coluna_i, coluna_j), tabela in self._tabelas.items():
+            resultados[(coluna_i, coluna_j)] = self.testar_tabela(tabela)
+        return resultados
+
 def exemplo_dados_independencia():
     """
     Exemplo: Verifica independência entre eventos em lançamento de dois dados
@@ -128,6 +314,14 @@ def exemplo_dados_independencia():
     print(f"   P(A) * P(B) simulada = {resultado_sim['prob_independencia']:.3f}")
     print(f"   Diferença simulada = {resultado_sim['diferenca']:.6f}")
     
+    print(f"\n4. ESPAÇO COM 8 DADOS (percorrido em blocos):")
+    espaco = EspacoProduto(faces=6, n_dados=8)
+    resultado_8 = ie.verificar_independencia(lambda e: e.d1 % 2 == 0,
+                                             lambda e: e.d2 + e.d8 > 9, espaco)
+    print(f"   {len(espaco)} resultados, nenhum guardado em lista")
+    print(f"   P(A ∩ B) = {resultado_8['prob_a_e_b']:.4f}, P(A) * P(B) = {resultado_8['prob_independencia']:.4f}")
+    print(f"   Eventos são independentes: {resultado_8['independencia']}")
+    
     return resultado
 
 def exemplo_dados_dependencia():
@@ -356,6 +550,61 @@ def demonstrar_propriedades_independencia():
     print("   Se A e B são independentes, então P(A|B) = P(A)")
     print("   e P(B|A) = P(B)")
 
+def exemplo_matriz_independencia():
+    """
+    Exemplo: independência de todos os pares entre vários eventos de três dados
+    """
+    print("\n=== MATRIZ DE INDEPENDÊNCIA ===\n")
+    
+    eventos = {
+        'D1 par': lambda e: e.d1 % 2 == 0,
+        'D2 ≥ 5': lambda e: e.d2 >= 5,
+        'D3 = 6': lambda e: e.d3 == 6,
+        'Soma par': lambda e: (e.d1 + e.d2 + e.d3) % 2 == 0,
+        'Soma ≥ 14': lambda e: e.d1 + e.d2 + e.d3 >= 14,
+    }
+    
+    ie = IndependenciaEventos()
+    resultado = ie.matriz_independencia(list(eventos.values()), EspacoProduto(faces=6, n_dados=3))
+    
+    nomes = list(eventos)
+    print(" " * 11 + "".join(f"{nome:>11}" for nome in nomes))
+    for i, nome in enumerate(nomes):
+        linha = "".join(f"{'sim' if resultado['independencia'][i, j] else 'não':>11}"
+                        for j in range(len(nomes)))
+        print(f"{nome:>11}{linha}")
+    
+    print("\n   'D1 par' e 'Soma par' são independentes par a par com 'D2 ≥ 5',")
+    print("   mas 'Soma ≥ 14' depende de cada dado.")
+    
+    return resultado
+
+def exemplo_teste_qui_quadrado():
+    """
+    Exemplo: teste qui-quadrado e informação mútua sobre dados lidos em blocos
+    """
+    print("\n=== TESTE QUI-QUADRADO EM BLOCOS ===\n")
+    
+    rng = np.random.default_rng(7)
+    acumulador = AcumuladorContingencia(['regiao', 'dispositivo', 'compra'])
+    
+    # 2 milhões de linhas, processadas em blocos de 250 mil
+    for _ in range(8):
+        n = 250_000
+        regiao = rng.choice(['norte', 'sul', 'leste', 'oeste'], size=n)
+        dispositivo = rng.choice(['celular', 'computador'], size=n, p=[0.7, 0.3])
+        # A chance de compra depende do dispositivo, mas não da região
+        compra = rng.random(n) < np.where(dispositivo == 'computador', 0.12, 0.08)
+        acumulador.atualizar({'regiao': regiao, 'dispositivo': dispositivo, 'compra': compra})
+    
+    print(f"   Linhas processadas: {acumulador.n_linhas}")
+    for (coluna_i, coluna_j), r in acumulador.testar().items():
+        print(f"   {coluna_i:>11} × {coluna_j:<11} χ² = {r['qui_quadrado']:10.2f}"
+              f"  gl = {r['graus_liberdade']}  p = {r['p_valor']:.3g}"
+              f"  IM = {r['informacao_mutua']:.2e} bits")
+    
+    return acumulador
+
 if __name__ == "__main__":
     # Executa todos os exemplos
     resultado_indep = exemplo_dados_independencia()
@@ -366,3 +615,5 @@ if __name__ == "__main__":
     # Visualizações
     plotar_independencia_vs_dependencia()
     demonstrar_propriedades_independencia()
+    exemplo_matriz_independencia()
+    exemplo_teste_qui_quadrado()
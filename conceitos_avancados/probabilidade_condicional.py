@@ -9,58 +9,256 @@ Telefones: (11) 98801-0667 | (92) 98456-1928
 Data: Setembro 2025
 """
 
-import random
+import os
+import sys
 import matplotlib.pyplot as plt
 from collections import Counter
+from statistics import NormalDist
 import numpy as np
 
+# Permite importar os módulos do repositório também ao executar este arquivo diretamente
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conceitos_avancados.espaco_amostral import (EspacoAmostral, EspacoProduto, codificar_categorias,
+                                                 medir_par_eventos)
+
 class ProbabilidadeCondicional:
     """
     Classe para demonstrar probabilidade condicional
+    
+    O espaço amostral pode ser uma lista de resultados, um EspacoAmostral
+    (colunas NumPy) ou um EspacoProduto (percorrido em blocos, sem ser
+    materializado). Cada evento é avaliado uma única vez como máscara
+    booleana; eventos vetorizados (ex.: lambda e: e.d1 + e.d2 == 7) evitam
+    qualquer laço em Python.
     """
     
-    def __init__(self):
-        pass
+    def __init__(self, semente=None):
+        self.rng = np.random.default_rng(semente)
+    
+    def calcular_probabilidades(self, evento_a, evento_b, espaco_amostral):
+        """
+        Calcula P(A), P(B), P(A ∩ B), P(A|B) e P(B|A) numa única passada
+        """
+        total, medida_a, medida_b, medida_a_e_b = medir_par_eventos(
+            espaco_amostral, evento_a, evento_b)
+        
+        return {
+            'prob_a': medida_a / total,
+            'prob_b': medida_b / total,
+            'prob_a_e_b': medida_a_e_b / total,
+            'prob_a_dado_b': medida_a_e_b / medida_b if medida_b else 0,
+            'prob_b_dado_a': medida_a_e_b / medida_a if medida_a else 0,
+        }
     
     def calcular_probabilidade_condicional(self, evento_a, evento_b, espaco_amostral):
         """
         Calcula P(A|B) = P(A ∩ B) / P(B)
         """
-        # P(A ∩ B)
-        intersecao = [x for x in espaco_amostral if evento_a(x) and evento_b(x)]
-        prob_intersecao = len(intersecao) / len(espaco_amostral)
+        return self.calcular_probabilidades(evento_a, evento_b, espaco_amostral)['prob_a_dado_b']
+    
+    def estimar_probabilidade_condicional(self, evento_a, evento_b=None, n_simulacoes=100000,
+                                          n_dados=2, faces=6, condicao=None, proposta=None,
+                                          confianca=0.95, tamanho_bloco=1 << 20):
+        """
+        Estima P(A|B) por Monte Carlo vetorizado, em lotes de dados sorteados
+        
+        Três modos de amostragem:
+        - padrão: sorteia dados honestos e usa só as amostras em que B ocorre
+        - condicao: dicionário {'d1': [4], ...} com os valores permitidos de
+          cada dado. Se B é esse evento (produto de restrições por dado), as
+          amostras vêm direto da distribuição condicional e nenhuma é
+          descartada; evento_b, se dado, restringe B ainda mais
+        - proposta: probabilidades das faces (um vetor, ou uma linha por
+          dado) de uma distribuição que favorece B; cada amostra recebe o
+          peso de importância P_honesto / P_proposta
+        
+        Retorna a estimativa autonormalizada, o tamanho efetivo da amostra
+        (Σw)²/Σw² e o intervalo de confiança normal para P(A|B).
+        """
+        if condicao is not None and proposta is not None:
+            raise ValueError("Use condicao ou proposta, não os dois")
+        if condicao is None and evento_b is None:
+            raise ValueError("Informe evento_b ou condicao")
+        
+        nomes = [f'd{i + 1}' for i in range(n_dados)]
+        
+        # Valores possíveis e probabilidades de amostragem de cada dado
+        valores = [np.arange(1, faces + 1)] * n_dados
+        if condicao is not None:
+            desconhecidas = set(condicao) - set(nomes)
+            if desconhecidas:
+                raise ValueError(f"Dados inexistentes na condição: {sorted(desconhecidas)}")
+            valores = [np.asarray(condicao.get(nome, valores[i])) for i, nome in enumerate(nomes)]
+            if any(len(v) == 0 for v in valores):
+                raise ValueError("A condição não pode excluir todos os valores de um dado")
+            for nome, v in zip(nomes, valores):
+                if np.any((v < 1) | (v > faces)) or np.any(v != np.round(v)):
+                    raise ValueError(f"Valores de {nome} na condição devem ser faces entre 1 e {faces}")
         
-        # P(B)
-        evento_b_resultados = [x for x in espaco_amostral if evento_b(x)]
-        prob_b = len(evento_b_resultados) / len(espaco_amostral)
+        razoes = None
+        if proposta is not None:
+            proposta = np.broadcast_to(np.asarray(proposta, dtype=np.float64), (n_dados, faces))
+            if np.any(proposta <= 0):
+                raise ValueError("A proposta deve dar probabilidade positiva a todas as faces")
+            proposta = proposta / proposta.sum(axis=1, keepdims=True)
+            razoes = (1 / faces) / proposta
         
-        if prob_b == 0:
-            return 0
+        soma_pesos = soma_pesos_quadrados = soma_pesos_a = soma_quadrados_a = 0.0
+        amostras_em_b = 0
         
-        return prob_intersecao / prob_b
+        for inicio in range(0, n_simulacoes, tamanho_bloco):
+            tamanho = min(tamanho_bloco, n_simulacoes - inicio)
+            colunas = {}
+            pesos = np.ones(tamanho)
+            for i, nome in enumerate(nomes):
+                if razoes is None:
+                    indices = self.rng.integers(len(valores[i]), size=tamanho)
+                else:
+                    indices = self.rng.choice(faces, size=tamanho, p=proposta[i])
+                    pesos *= razoes[i][indices]
+                colunas[nome] = valores[i][indices]
+            bloco = EspacoAmostral(colunas)
+            
+            em_b = np.ones(tamanho, dtype=bool) if evento_b is None else bloco.avaliar(evento_b)
+            em_a = bloco.avaliar(evento_a)[em_b]
+            pesos = pesos[em_b]
+            
+            amostras_em_b += len(pesos)
+            soma_pesos += pesos.sum()
+            soma_pesos_quadrados += np.dot(pesos, pesos)
+            soma_pesos_a += pesos[em_a].sum()
+            soma_quadrados_a += np.dot(pesos[em_a], pesos[em_a])
+        
+        if soma_pesos == 0:
+            return {'estimativa': 0, 'erro_padrao': np.nan, 'intervalo': (0, 1),
+                    'tamanho_efetivo': 0, 'n_amostras': n_simulacoes, 'amostras_em_b': 0}
+        
+        estimativa = soma_pesos_a / soma_pesos
+        
+        # Variância do estimador de razão: Σ w²(1_A - p)² / (Σw)²
+        soma_desvios = (soma_quadrados_a * (1 - estimativa) ** 2
+                        + (soma_pesos_quadrados - soma_quadrados_a) * estimativa ** 2)
+        erro_padrao = np.sqrt(soma_desvios) / soma_pesos
+        z = NormalDist().inv_cdf(0.5 + confianca / 2)
+        
+        return {
+            'estimativa': estimativa,
+            'erro_padrao': erro_padrao,
+            'intervalo': (max(0.0, estimativa - z * erro_padrao),
+                          min(1.0, estimativa + z * erro_padrao)),
+            'tamanho_efetivo': soma_pesos ** 2 / soma_pesos_quadrados,
+            'n_amostras': n_simulacoes,
+            'amostras_em_b': amostras_em_b,
+        }
     
     def simular_probabilidade_condicional(self, evento_a, evento_b, n_simulacoes=10000):
         """
         Simula probabilidade condicional usando Monte Carlo
         """
-        # Simula lançamentos de dois dados
-        resultados_a_dado_b = []
-        total_evento_b = 0
+        return self.estimar_probabilidade_condicional(evento_a, evento_b, n_simulacoes)['estimativa']
+
+class CuboContingencia:
+    """
+    Histograma multidimensional de colunas categóricas para consultas repetidas
+    
+    As contagens de todas as combinações de categorias são calculadas uma
+    única vez (np.bincount sobre o índice linear das combinações). Cada
+    consulta soma uma fatia de uma marginal; as marginais são calculadas
+    sob demanda, a partir da menor marginal já guardada que as contém, e
+    ficam em cache.
+    
+    Eventos são dicionários {coluna: valor} ou {coluna: [valores]}.
+    Valores ausentes (None, NaN) formam a categoria AUSENTE da coluna e
+    podem ser consultados com None ou NaN.
+    """
+    
+    AUSENTE = None
+    
+    def __init__(self, dados, colunas=None):
+        colunas = list(dados.keys()) if colunas is None else list(colunas)
+        if not colunas:
+            raise ValueError("Informe pelo menos uma coluna")
+        
+        self.colunas = colunas
+        self.categorias = {}
+        self._codigos = {}
+        indices = []
+        for coluna in colunas:
+            self.categorias[coluna] = []
+            self._codigos[coluna] = {}
+            indices.append(codificar_categorias(dados[coluna], self._codigos[coluna],
+                                                self.categorias[coluna], self.AUSENTE, ordenar=True))
+        
+        forma = tuple(len(self.categorias[coluna]) for coluna in colunas)
+        linear = np.ravel_multi_index(indices, forma)
+        self.contagens = np.bincount(linear, minlength=int(np.prod(forma))).reshape(forma)
+        self.n_linhas = int(self.contagens.sum())
+        
+        # eixos mantidos -> contagens marginais
+        self._marginais = {tuple(range(len(colunas))): self.contagens}
+    
+    def marginal(self, eixos):
+        """
+        Contagens marginais sobre os eixos dados (em ordem crescente)
+        """
+        eixos = tuple(sorted(set(eixos)))
+        if eixos not in self._marginais:
+            # Parte da menor marginal em cache que contém os eixos pedidos
+            origem = min((chave for chave in self._marginais if set(eixos) <= set(chave)),
+                         key=lambda chave: self._marginais[chave].size)
+            somar = tuple(i for i, eixo in enumerate(origem) if eixo not in eixos)
+            self._marginais[eixos] = self._marginais[origem].sum(axis=somar)
+        return self._marginais[eixos]
+    
+    def _contar(self, *eventos):
+        """
+        Número de linhas em que todos os eventos ocorrem
+        """
+        selecao = {}
+        for evento in eventos:
+            for coluna, valores in evento.items():
+                if coluna not in self._codigos:
+                    raise ValueError(f"Coluna fora do cubo: {coluna}")
+                if not isinstance(valores, (list, tuple, set, np.ndarray)):
+                    valores = [valores]
+                # NaN não é igual a si mesmo: consulta a categoria AUSENTE
+                valores = [self.AUSENTE if isinstance(v, float) and np.isnan(v) else v for v in valores]
+                codigos = {self._codigos[coluna][v] for v in valores if v in self._codigos[coluna]}
+                # A mesma coluna em dois eventos: interseção das categorias
+                selecao[coluna] = selecao[coluna] & codigos if coluna in selecao else codigos
         
-        for _ in range(n_simulacoes):
-            dado1 = random.randint(1, 6)
-            dado2 = random.randint(1, 6)
-            resultado = (dado1, dado2)
-            
-            if evento_b(resultado):
-                total_evento_b += 1
-                if evento_a(resultado):
-                    resultados_a_dado_b.append(resultado)
+        if not selecao:
+            return self.n_linhas
         
-        if total_evento_b == 0:
-            return 0
+        eixos = sorted(self.colunas.index(coluna) for coluna in selecao)
+        indices = [sorted(selecao[self.colunas[eixo]]) for eixo in eixos]
+        return int(self.marginal(eixos)[np.ix_(*indices)].sum())
+    
+    def probabilidade(self, evento, dado=None):
+        """
+        P(evento), ou P(evento | dado) quando dado é informado
+        """
+        if dado is None:
+            return self._contar(evento) / self.n_linhas
+        contagem_dado = self._contar(dado)
+        return self._contar(evento, dado) / contagem_dado if contagem_dado else 0
+    
+    def probabilidades(self, evento_a, evento_b):
+        """
+        P(A), P(B), P(A ∩ B), P(A|B) e P(B|A), como em ProbabilidadeCondicional
+        """
+        contagem_a = self._contar(evento_a)
+        contagem_b = self._contar(evento_b)
+        contagem_a_e_b = self._contar(evento_a, evento_b)
         
-        return len(resultados_a_dado_b) / total_evento_b
+        return {
+            'prob_a': contagem_a / self.n_linhas,
+            'prob_b': contagem_b / self.n_linhas,
+            'prob_a_e_b': contagem_a_e_b / self.n_linhas,
+            'prob_a_dado_b': contagem_a_e_b / contagem_b if contagem_b else 0,
+            'prob_b_dado_a': contagem_a_e_b / contagem_a if contagem_a else 0,
+        }
 
 def exemplo_dados_soma():
     """
@@ -105,6 +303,29 @@ def exemplo_dados_soma():
     prob_simulada = pc.simular_probabilidade_condicional(evento_a, evento_b, 10000)
     print(f"   P(A|B) simulada = {prob_simulada:.3f}")
     
+    print("\n4. ESPAÇO AMOSTRAL VETORIZADO:")
+    espaco = EspacoAmostral.dados(n_dados=2)
+    probabilidades = pc.calcular_probabilidades(lambda e: e.d1 + e.d2 == 7,
+                                                lambda e: e.d1 == 4, espaco)
+    print(f"   Colunas: {espaco.nomes} ({len(espaco)} resultados)")
+    print(f"   P(A ∩ B) = {probabilidades['prob_a_e_b']:.3f}")
+    print(f"   P(A|B) = {probabilidades['prob_a_dado_b']:.3f}")
+    print(f"   P(B|A) = {probabilidades['prob_b_dado_a']:.3f}")
+    
+    # Com 10 dados o espaço tem 6^10 ≈ 6e7 resultados, percorridos em blocos
+    espaco = EspacoProduto(faces=6, n_dados=10)
+    prob_soma = pc.calcular_probabilidade_condicional(
+        lambda e: sum(e[i] for i in range(10)) >= 45, lambda e: e.d1 == 6, espaco)
+    print(f"   10 dados: P(soma ≥ 45 | primeiro dado é 6) = {prob_soma:.5f}")
+    
+    # Eventos simétricos: basta enumerar os multiconjuntos, com pesos multinomiais
+    espaco = EspacoProduto(faces=6, n_dados=15, simetrico=True)
+    prob_seis = pc.calcular_probabilidade_condicional(
+        lambda e: sum(e[i] == 6 for i in range(15)) >= 5,
+        lambda e: sum(e[i] for i in range(15)) >= 60, espaco)
+    print(f"   15 dados ({len(espaco)} multiconjuntos): "
+          f"P(pelo menos cinco seis | soma ≥ 60) = {prob_seis:.5f}")
+    
     return prob_condicional, prob_simulada
 
 def exemplo_baralho_cartas():
@@ -287,6 +508,64 @@ def demonstrar_regra_multiplicacao():
     print(f"   Regra da multiplicação: {prob_multiplicacao:.3f}")
     print(f"   Diferença: {abs(prob_direta - prob_multiplicacao):.6f}")
 
+def demonstrar_monte_carlo_condicional():
+    """
+    Compara rejeição, amostragem condicional direta e pesos de importância
+    """
+    print("\n=== MONTE CARLO CONDICIONAL ===\n")
+    
+    pc = ProbabilidadeCondicional(semente=42)
+    soma_7 = lambda e: e.d1 + e.d2 == 7
+    
+    print("1. P(soma 7 | primeiro dado é 4), 60.000 amostras:")
+    rejeicao = pc.estimar_probabilidade_condicional(soma_7, lambda e: e.d1 == 4, 60000)
+    direta = pc.estimar_probabilidade_condicional(soma_7, condicao={'d1': [4]}, n_simulacoes=60000)
+    for nome, r in [("Rejeição", rejeicao), ("Condicional direta", direta)]:
+        print(f"   {nome:20}: {r['estimativa']:.4f}  IC95% = [{r['intervalo'][0]:.4f}, {r['intervalo'][1]:.4f}]"
+              f"  amostras efetivas = {r['tamanho_efetivo']:.0f}")
+    
+    print("\n2. Evento raro: P(todos ≥ 4 | soma de 10 dados ≥ 50), 200.000 amostras:")
+    soma_alta = lambda e: sum(e[i] for i in range(10)) >= 50
+    todos_altos = lambda e: np.all([e[i] >= 4 for i in range(10)], axis=0)
+    exato = pc.calcular_probabilidade_condicional(
+        todos_altos, soma_alta, EspacoProduto(faces=6, n_dados=10, simetrico=True))
+    
+    rejeicao = pc.estimar_probabilidade_condicional(todos_altos, soma_alta, 200000, n_dados=10)
+    proposta = np.array([1, 1, 2, 4, 8, 16])
+    importancia = pc.estimar_probabilidade_condicional(todos_altos, soma_alta, 200000, n_dados=10,
+                                                       proposta=proposta)
+    print(f"   Exato                : {exato:.4f}")
+    for nome, r in [("Rejeição", rejeicao), ("Importância", importancia)]:
+        print(f"   {nome:20}: {r['estimativa']:.4f}  IC95% = [{r['intervalo'][0]:.4f}, {r['intervalo'][1]:.4f}]"
+              f"  amostras em B = {r['amostras_em_b']}, efetivas = {r['tamanho_efetivo']:.0f}")
+
+def exemplo_cubo_contingencia():
+    """
+    Exemplo: muitas consultas condicionais sobre a mesma tabela de pacientes
+    """
+    print("\n=== CUBO DE CONTINGÊNCIA ===\n")
+    
+    rng = np.random.default_rng(42)
+    n = 1_000_000
+    faixa = rng.choice(['jovem', 'adulto', 'idoso'], size=n, p=[0.3, 0.5, 0.2])
+    fumante = rng.random(n) < 0.25
+    risco = 0.02 + 0.05 * fumante + np.select([faixa == 'adulto', faixa == 'idoso'], [0.03, 0.10], 0)
+    doenca = rng.random(n) < risco
+    
+    cubo = CuboContingencia({'faixa': faixa, 'fumante': fumante, 'doenca': doenca})
+    print(f"   {cubo.n_linhas} pacientes, cubo de forma {cubo.contagens.shape}")
+    
+    print(f"   P(doença) = {cubo.probabilidade({'doenca': True}):.4f}")
+    print(f"   P(doença | fumante) = {cubo.probabilidade({'doenca': True}, {'fumante': True}):.4f}")
+    for valor in cubo.categorias['faixa']:
+        prob = cubo.probabilidade({'doenca': True}, {'faixa': valor, 'fumante': True})
+        print(f"   P(doença | fumante, {valor}) = {prob:.4f}")
+    
+    probabilidades = cubo.probabilidades({'faixa': ['adulto', 'idoso']}, {'doenca': True})
+    print(f"   P(adulto ou idoso | doença) = {probabilidades['prob_a_dado_b']:.4f}")
+    
+    return cubo
+
 if __name__ == "__main__":
     # Executa todos os exemplos
     prob_dados, prob_sim = exemplo_dados_soma()
@@ -296,3 +575,5 @@ if __name__ == "__main__":
     # Visualizações
     plotar_probabilidade_condicional()
     demonstrar_regra_multiplicacao()
+    demonstrar_monte_carlo_condicional()
+    exemplo_cubo_contingencia()
@@ -13,6 +13,36 @@ import random
 import matplotlib.pyplot as plt
 import numpy as np
 from collections import Counter
+from scipy import stats
+
+def log_soma_exp(valores, eixo=-1):
+    """
+    log(Σ exp(valores)) ao longo de um eixo, sem underflow nem overflow
+    """
+    valores = np.asarray(valores, dtype=np.float64)
+    maximo = np.max(valores, axis=eixo, keepdims=True)
+    maximo = np.where(np.isfinite(maximo), maximo, 0)
+    soma = np.sum(np.exp(valores - maximo), axis=eixo, keepdims=True)
+    with np.errstate(divide='ignore'):
+        return np.squeeze(maximo + np.log(soma), axis=eixo)
+
+def _posteriores_em_blocos(log_base, log_pesos, casos, tamanho_bloco, retornar_log):
+    """
+    Normaliza casos @ log_pesos + log_base por linha, em blocos de casos
+    
+    Blocos densos de outros tipos (bool, inteiros) são convertidos para
+    float64 um de cada vez, para o produto usar o BLAS sem perder precisão.
+    """
+    resultado = np.empty((casos.shape[0], len(log_base)))
+    for inicio in range(0, casos.shape[0], tamanho_bloco):
+        fim = min(inicio + tamanho_bloco, casos.shape[0])
+        bloco = casos[inicio:fim]
+        if isinstance(bloco, np.ndarray):
+            bloco = bloco.astype(np.float64, copy=False)
+        log_conjunta = np.asarray(bloco @ log_pesos) + log_base
+        log_posterior = log_conjunta - log_soma_exp(log_conjunta)[:, None]
+        resultado[inicio:fim] = log_posterior if retornar_log else np.exp(log_posterior)
+    return resultado
 
 class TeoremaBayes:
     """
@@ -26,19 +56,458 @@ class TeoremaBayes:
         """
         Calcula P(A|B) usando o Teorema de Bayes
         P(A|B) = P(B|A) * P(A) / P(B)
+        
+        Aceita escalares ou arrays NumPy, combinados por broadcasting; onde
+        P(B) = 0 o resultado é 0.
         """
-        if prob_b == 0:
-            return 0
-        return (prob_b_dado_a * prob_a) / prob_b
+        numerador = np.multiply(prob_b_dado_a, prob_a)
+        prob_b = np.asarray(prob_b, dtype=np.float64)
+        forma = np.broadcast_shapes(numerador.shape, prob_b.shape)
+        posterior = np.divide(numerador, prob_b, out=np.zeros(forma), where=prob_b != 0)
+        return float(posterior) if posterior.ndim == 0 else posterior
     
     def calcular_bayes_completo(self, prob_a, prob_b_dado_a, prob_b_dado_nao_a):
         """
         Calcula P(A|B) usando o Teorema de Bayes completo
         P(A|B) = P(B|A) * P(A) / [P(B|A) * P(A) + P(B|A') * P(A')]
+        
+        Como calcular_bayes, aceita arrays: prevalências × sensibilidades ×
+        taxas de falso positivo em grade são avaliadas numa única chamada.
         """
-        prob_nao_a = 1 - prob_a
-        prob_b = prob_b_dado_a * prob_a + prob_b_dado_nao_a * prob_nao_a
+        prob_a = np.asarray(prob_a, dtype=np.float64)
+        prob_b = np.multiply(prob_b_dado_a, prob_a) + np.multiply(prob_b_dado_nao_a, 1 - prob_a)
         return self.calcular_bayes(prob_a, prob_b_dado_a, prob_b)
+    
+    def calcular_bayes_log(self, priors, verossimilhancas, casos, tamanho_bloco=1 << 16,
+                           retornar_log=False):
+        """
+        Posteriores de várias hipóteses para um lote de casos, em escala logarítmica
+        
+        priors: (H,) probabilidades a priori das hipóteses
+        verossimilhancas: (H, E) P(item de evidência e | hipótese h)
+        casos: (N, E) quantas vezes cada item foi observado em cada caso
+        (0/1, contagens; pode ser uma matriz esparsa do scipy), ou (E,)
+        para um único caso
+        
+        log P(h | caso) = log P(h) + Σ_e casos[e] log P(e | h) - log P(caso):
+        o produto das evidências vira um produto matricial e a normalização
+        usa log-soma-exp, então milhares de evidências não causam underflow.
+        Verossimilhanças nulas são tratadas como o menor float positivo.
+        Os casos são processados em blocos de tamanho_bloco linhas.
+        """
+        priors = np.asarray(priors, dtype=np.float64)
+        verossimilhancas = np.asarray(verossimilhancas, dtype=np.float64)
+        if verossimilhancas.ndim != 2 or verossimilhancas.shape[0] != len(priors):
+            raise ValueError("verossimilhancas deve ter forma (hipóteses, itens de evidência)")
+        if np.any(priors < 0) or np.any(verossimilhancas < 0):
+            raise ValueError("Probabilidades não podem ser negativas")
+        
+        if not hasattr(casos, 'shape'):
+            casos = np.asarray(casos)
+        um_caso = casos.ndim == 1
+        if um_caso:
+            casos = casos[None, :]
+        if casos.shape[1] != verossimilhancas.shape[1]:
+            raise ValueError("Cada caso deve ter um valor por item de evidência")
+        
+        with np.errstate(divide='ignore'):
+            log_priors = np.log(priors / priors.sum())
+        log_verossimilhancas = np.log(np.maximum(verossimilhancas, np.finfo(np.float64).tiny)).T
+        
+        resultado = _posteriores_em_blocos(log_priors, log_verossimilhancas, casos,
+                                           tamanho_bloco, retornar_log)
+        return resultado[0] if um_caso else resultado
+    
+    def posterior_em_grade(self, log_verossimilhanca, limites, dados, log_priori=None,
+                           n_pontos=101, refinamentos=2, massa=1 - 1e-9, folga=2):
+        """
+        Posterior de um parâmetro contínuo (1-D ou 2-D) numa grade, para um lote de conjuntos de dados
+        
+        log_verossimilhanca(parametros, dados) recebe uma tupla com um array
+        por dimensão, de forma (1, G) ou (B, G) (G pontos avaliados), e deve
+        devolver o log da verossimilhança de cada um dos B conjuntos de dados
+        em cada ponto, forma (B, G); em geral basta guardar os dados com
+        forma (B, 1) para o broadcasting funcionar. log_priori(parametros)
+        segue a mesma convenção (padrão: priori uniforme nos limites).
+        
+        A grade tem n_pontos células por dimensão e a massa de cada célula é
+        integrada com a regra de Gauss-Legendre de 3 pontos (exata para
+        polinômios de grau 5), em vez de densidade no centro vezes largura.
+        A primeira grade cobre os limites; cada refinamento refaz a grade,
+        por conjunto de dados, na caixa que contém a fração massa da
+        posterior mais folga células de cada lado. Com a cauda cortada em
+        1e-9 a massa descartada não pesa nas médias; o primeiro refinamento
+        concentra a grade na posterior e os seguintes corrigem a caixa quando
+        a posterior é estreita demais para a grade anterior localizá-la.
+        
+        Retorna os centros (B, n_pontos) das células de cada dimensão, a massa
+        posterior de cada célula (B, n_pontos[, n_pontos]), a média e o desvio padrão.
+        """
+        limites = np.asarray(limites, dtype=np.float64).reshape(-1, 2)
+        dimensoes = len(limites)
+        if dimensoes not in (1, 2):
+            raise ValueError("A grade deve ter 1 ou 2 dimensões")
+        if np.any(limites[:, 0] >= limites[:, 1]):
+            raise ValueError("Cada limite inferior deve ser menor que o superior")
+        
+        nos, pesos = np.polynomial.legendre.leggauss(3)
+        # Posição (em células) de cada nó de Gauss, célula a célula, e seu peso
+        posicoes = (np.arange(n_pontos)[:, None] + (nos + 1) / 2).ravel()
+        pesos = np.tile(pesos, n_pontos)
+        
+        def avaliar(inferiores, superiores):
+            passos = (superiores - inferiores) / n_pontos
+            pontos = [inferiores[:, [i]] + posicoes * passos[:, [i]] for i in range(dimensoes)]
+            if dimensoes == 1:
+                parametros = (pontos[0],)
+            else:
+                parametros = (np.repeat(pontos[0], len(posicoes), axis=1),
+                              np.tile(pontos[1], (1, len(posicoes))))
+            
+            log_posterior = np.asarray(log_verossimilhanca(parametros, dados), dtype=np.float64)
+            if log_priori is not None:
+                log_posterior = log_posterior + log_priori(parametros)
+            log_posterior = np.atleast_2d(log_posterior)
+            
+            densidade = np.exp(log_posterior - log_posterior.max(axis=1, keepdims=True))
+            densidade = densidade.reshape((len(densidade),) + (len(posicoes),) * dimensoes)
+            for i in range(dimensoes):
+                densidade = densidade * pesos.reshape((-1,) + (1,) * (dimensoes - 1 - i))
+            densidade /= densidade.sum(axis=tuple(range(1, dimensoes + 1)), keepdims=True)
+            
+            # Massa de cada célula: soma dos seus 3 nós em cada dimensão
+            forma = (len(densidade),) + (n_pontos, 3) * dimensoes
+            celulas = densidade.reshape(forma).sum(axis=tuple(range(2, 2 * dimensoes + 1, 2)))
+            return inferiores, passos, pontos, densidade, celulas
+        
+        def marginal(valores, i):
+            return valores.sum(axis=tuple(j for j in range(1, dimensoes + 1) if j != i + 1))
+        
+        inferiores, passos, pontos, densidade, celulas = avaliar(limites[None, :, 0], limites[None, :, 1])
+        
+        cauda = (1 - massa) / 2
+        for _ in range(refinamentos):
+            novos_inferiores = np.empty((len(celulas), dimensoes))
+            novos_superiores = np.empty((len(celulas), dimensoes))
+            for i in range(dimensoes):
+                acumulada = np.cumsum(marginal(celulas, i), axis=1)
+                baixo = np.argmax(acumulada >= cauda, axis=1)
+                alto = np.argmax(acumulada >= 1 - cauda, axis=1)
+                
+                inicio, passo = inferiores[:, i], passos[:, i]
+                novos_inferiores[:, i] = np.maximum(inicio + (baixo - folga) * passo, limites[i, 0])
+                novos_superiores[:, i] = np.minimum(inicio + (alto + 1 + folga) * passo, limites[i, 1])
+            inferiores, passos, pontos, densidade, celulas = avaliar(novos_inferiores, novos_superiores)
+        
+        n_lote = len(celulas)
+        eixos = [np.broadcast_to(inferiores[:, [i]] + (np.arange(n_pontos) + 0.5) * passos[:, [i]],
+                                 (n_lote, n_pontos)) for i in range(dimensoes)]
+        medias = np.empty((n_lote, dimensoes))
+        desvios = np.empty((n_lote, dimensoes))
+        for i in range(dimensoes):
+            massa_nos = marginal(densidade, i)
+            x = np.broadcast_to(pontos[i], massa_nos.shape)
+            medias[:, i] = np.sum(massa_nos * x, axis=1)
+            desvios[:, i] = np.sqrt(np.sum(massa_nos * (x - medias[:, [i]]) ** 2, axis=1))
+        
+        return {
+            'eixos': eixos,
+            'posterior': celulas,
+            'media': medias,
+            'desvio_padrao': desvios
+        }
+
+class DiagnosticoBayesiano:
+    """
+    Triagem de pacientes para várias doenças a partir de sintomas presentes/ausentes
+    
+    prevalencias: (D,) probabilidade a priori de cada diagnóstico (doenças
+    mutuamente exclusivas; inclua "sem doença" como um diagnóstico)
+    verossimilhancas: (D, S) P(sintoma s presente | diagnóstico d)
+    
+    Com sintomas condicionalmente independentes,
+    log P(x | d) = Σ_s x_s log(p/(1-p)) + Σ_s log(1-p), então a matriz de
+    log-posteriores de todos os pacientes sai de um único produto matricial
+    pacientes @ log-razões, que também funciona com matrizes esparsas.
+    """
+    
+    def __init__(self, prevalencias, verossimilhancas, diagnosticos=None, sintomas=None):
+        prevalencias = np.asarray(prevalencias, dtype=np.float64)
+        verossimilhancas = np.asarray(verossimilhancas, dtype=np.float64)
+        if verossimilhancas.ndim != 2 or verossimilhancas.shape[0] != len(prevalencias):
+            raise ValueError("verossimilhancas deve ter forma (diagnósticos, sintomas)")
+        if np.any(prevalencias < 0) or np.any((verossimilhancas < 0) | (verossimilhancas > 1)):
+            raise ValueError("Probabilidades devem estar entre 0 e 1")
+        
+        self.diagnosticos = (list(diagnosticos) if diagnosticos is not None
+                             else [f'diagnóstico {d}' for d in range(len(prevalencias))])
+        self.sintomas = (list(sintomas) if sintomas is not None
+                         else [f'sintoma {s}' for s in range(verossimilhancas.shape[1])])
+        
+        # Probabilidades 0 e 1 viram valores extremos, mas finitos
+        epsilon = np.finfo(np.float64).eps
+        p = np.clip(verossimilhancas, epsilon, 1 - epsilon)
+        with np.errstate(divide='ignore'):
+            self._log_base = np.log(prevalencias / prevalencias.sum()) + np.log1p(-p).sum(axis=1)
+        self._log_razoes = (np.log(p) - np.log1p(-p)).T
+    
+    def pontuar(self, pacientes, tamanho_bloco=1 << 16, retornar_log=False):
+        """
+        Matriz (pacientes, diagnósticos) de probabilidades posteriores
+        
+        pacientes: matriz booleana (pacientes, sintomas), densa ou esparsa,
+        ou um vetor com os sintomas de um único paciente.
+        """
+        if not hasattr(pacientes, 'shape'):
+            pacientes = np.asarray(pacientes)
+        um_paciente = pacientes.ndim == 1
+        if um_paciente:
+            pacientes = pacientes[None, :]
+        if pacientes.shape[1] != self._log_razoes.shape[0]:
+            raise ValueError(f"Esperados {self._log_razoes.shape[0]} sintomas por paciente")
+        
+        resultado = _posteriores_em_blocos(self._log_base, self._log_razoes, pacientes,
+                                           tamanho_bloco, retornar_log)
+        return resultado[0] if um_paciente else resultado
+    
+    def triagem(self, pacientes, tamanho_bloco=1 << 16):
+        """
+        Diagnóstico mais provável de cada paciente e sua probabilidade posterior
+        """
+        posteriores = self.pontuar(pacientes, tamanho_bloco)
+        posteriores = np.atleast_2d(posteriores)
+        indices = np.argmax(posteriores, axis=1)
+        return {
+            'indice': indices,
+            'diagnostico': np.array(self.diagnosticos, dtype=object)[indices],
+            'probabilidade': posteriores[np.arange(len(indices)), indices]
+        }
+
+class PosteriorBetaBinomial:
+    """
+    Atualização sequencial de uma proporção p com priori Beta(alfa, beta)
+    
+    Guarda só as estatísticas suficientes (sucessos e fracassos), então
+    cada observação custa O(1) e um lote custa O(tamanho do lote), sem
+    guardar o histórico.
+    """
+    
+    def __init__(self, alfa=1.0, beta=1.0):
+        if alfa <= 0 or beta <= 0:
+            raise ValueError("Os parâmetros da priori devem ser positivos")
+        self.alfa = float(alfa)
+        self.beta = float(beta)
+        self.n_observacoes = 0
+    
+    def atualizar(self, sucessos, tentativas=None):
+        """
+        Sem tentativas, sucessos é uma observação 0/1 ou um array delas;
+        com tentativas, são contagens (escalares ou arrays somados)
+        """
+        if tentativas is None:
+            observacoes = np.asarray(sucessos)
+            if np.any((observacoes != 0) & (observacoes != 1)):
+                raise ValueError("Observações devem ser 0 ou 1")
+            sucessos, tentativas = np.count_nonzero(observacoes), observacoes.size
+        else:
+            sucessos, tentativas = np.asarray(sucessos), np.asarray(tentativas)
+            if np.any(sucessos < 0) or np.any(tentativas < 0):
+                raise ValueError("Sucessos e tentativas devem ser não negativos")
+            # Compara lote a lote: um total válido pode esconder um lote impossível
+            if np.any(sucessos > tentativas):
+                raise ValueError("Há mais sucessos do que tentativas")
+            sucessos, tentativas = np.sum(sucessos), np.sum(tentativas)
+        
+        self.alfa += sucessos
+        self.beta += tentativas - sucessos
+        self.n_observacoes += int(tentativas)
+    
+    @property
+    def media(self):
+        return self.alfa / (self.alfa + self.beta)
+    
+    def intervalo_credibilidade(self, nivel=0.95):
+        """
+        Intervalo central com probabilidade posterior nivel
+        """
+        caudas = [(1 - nivel) / 2, (1 + nivel) / 2]
+        return tuple(stats.beta.ppf(caudas, self.alfa, self.beta))
+    
+    def probabilidade_preditiva(self, k, n=1):
+        """
+        P(k sucessos nas próximas n tentativas), pela Beta-Binomial
+        """
+        return stats.betabinom.pmf(k, n, self.alfa, self.beta)
+
+class PosteriorDirichletMultinomial:
+    """
+    Atualização sequencial das probabilidades de K categorias com priori Dirichlet(alfas)
+    """
+    
+    def __init__(self, alfas):
+        self.alfas = np.array(alfas, dtype=np.float64)
+        if self.alfas.ndim != 1 or len(self.alfas) < 2 or np.any(self.alfas <= 0):
+            raise ValueError("A priori precisa de pelo menos dois parâmetros positivos")
+        self.n_observacoes = 0
+    
+    def atualizar(self, categorias):
+        """
+        Registra uma categoria observada (0..K-1) ou um array delas
+        """
+        categorias = np.asarray(categorias).ravel()
+        if categorias.size and (categorias.min() < 0 or categorias.max() >= len(self.alfas)):
+            raise ValueError(f"Categorias devem estar entre 0 e {len(self.alfas) - 1}")
+        self.atualizar_contagens(np.bincount(categorias, minlength=len(self.alfas)))
+    
+    def atualizar_contagens(self, contagens):
+        """
+        Soma um vetor de contagens por categoria (ou uma matriz de lotes × categorias)
+        """
+        contagens = np.asarray(contagens)
+        if contagens.ndim == 2:
+            contagens = contagens.sum(axis=0)
+        if contagens.shape != self.alfas.shape or np.any(contagens < 0):
+            raise ValueError("Contagens devem ser não negativas, uma por categoria")
+        
+        self.alfas += contagens
+        self.n_observacoes += int(contagens.sum())
+    
+    @property
+    def media(self):
+        return self.alfas / self.alfas.sum()
+    
+    def intervalo_credibilidade(self, nivel=0.95):
+        """
+        Intervalos centrais de cada probabilidade (marginais Beta), forma (K, 2)
+        """
+        caudas = np.array([(1 - nivel) / 2, (1 + nivel) / 2])
+        resto = self.alfas.sum() - self.alfas
+        return stats.beta.ppf(caudas[None, :], self.alfas[:, None], resto[:, None])
+    
+    def probabilidade_preditiva(self, categoria=None):
+        """
+        P(próxima observação = categoria); sem categoria, o vetor inteiro
+        """
+        preditiva = self.media
+        return preditiva if categoria is None else preditiva[categoria]
+
+class PosteriorNormalNormal:
+    """
+    Atualização sequencial da média de uma Normal com variância do ruído conhecida
+    
+    Priori N(media_priori, variancia_priori); as observações só entram pela
+    soma e pela contagem.
+    """
+    
+    def __init__(self, media_priori=0.0, variancia_priori=1.0, variancia_ruido=1.0):
+        if variancia_priori <= 0 or variancia_ruido <= 0:
+            raise ValueError("As variâncias devem ser positivas")
+        self.variancia_ruido = float(variancia_ruido)
+        self._precisao = 1 / variancia_priori
+        self._precisao_vezes_media = media_priori / variancia_priori
+        self.n_observacoes = 0
+    
+    def atualizar(self, observacoes):
+        """
+        Registra uma observação ou um array delas
+        """
+        observacoes = np.asarray(observacoes, dtype=np.float64)
+        self._precisao += observacoes.size / self.variancia_ruido
+        self._precisao_vezes_media += observacoes.sum() / self.variancia_ruido
+        self.n_observacoes += observacoes.size
+    
+    @property
+    def media(self):
+        return self._precisao_vezes_media / self._precisao
+    
+    @property
+    def variancia(self):
+        return 1 / self._precisao
+    
+    def intervalo_credibilidade(self, nivel=0.95):
+        return tuple(stats.norm.interval(nivel, loc=self.media, scale=np.sqrt(self.variancia)))
+    
+    def probabilidade_preditiva(self, minimo=-np.inf, maximo=np.inf):
+        """
+        P(minimo < próxima observação < maximo), pela preditiva N(media, variancia + ruído)
+        """
+        preditiva = stats.norm(self.media, np.sqrt(self.variancia + self.variancia_ruido))
+        return preditiva.cdf(maximo) - preditiva.cdf(minimo)
+
+class TesteABBayesiano:
+    """
+    Testes A/B/n bayesianos para vários experimentos simultâneos
+    
+    Cada variante de cada experimento tem uma posterior Beta(alfa, beta)
+    para sua taxa de conversão, guardada em arrays (experimentos, variantes)
+    e atualizada com contagens. P(variante é a melhor) e a perda esperada
+    E[max_j p_j - p_k] são estimadas por Monte Carlo, com as amostras da
+    posterior sorteadas em lotes vetorizados de no máximo
+    max_elementos valores por vez.
+    """
+    
+    def __init__(self, n_variantes, n_experimentos=1, alfa=1.0, beta=1.0, semente=None):
+        if n_variantes < 2:
+            raise ValueError("São necessárias pelo menos duas variantes")
+        if alfa <= 0 or beta <= 0:
+            raise ValueError("Os parâmetros da priori devem ser positivos")
+        
+        forma = (n_experimentos, n_variantes)
+        self.alfa = np.full(forma, float(alfa))
+        self.beta = np.full(forma, float(beta))
+        self.rng = np.random.default_rng(semente)
+    
+    def atualizar(self, conversoes, visitantes):
+        """
+        Soma conversões e visitantes (escalares ou arrays compatíveis com (experimentos, variantes))
+        """
+        conversoes = np.broadcast_to(conversoes, self.alfa.shape)
+        visitantes = np.broadcast_to(visitantes, self.alfa.shape)
+        if np.any(conversoes < 0) or np.any(conversoes > visitantes):
+            raise ValueError("Conversões devem estar entre 0 e o número de visitantes")
+        
+        self.alfa += conversoes
+        self.beta += visitantes - conversoes
+    
+    @property
+    def media(self):
+        return self.alfa / (self.alfa + self.beta)
+    
+    def intervalo_credibilidade(self, nivel=0.95):
+        """
+        Intervalos centrais de cada variante, forma (experimentos, variantes, 2)
+        """
+        caudas = np.array([(1 - nivel) / 2, (1 + nivel) / 2])
+        return stats.beta.ppf(caudas, self.alfa[..., None], self.beta[..., None])
+    
+    def comparar(self, n_amostras=20000, max_elementos=1 << 22):
+        """
+        P(cada variante ser a melhor) e perda esperada de escolhê-la
+        """
+        n_experimentos, n_variantes = self.alfa.shape
+        tamanho_bloco = max(1, max_elementos // (n_experimentos * n_variantes))
+        
+        vitorias = np.zeros(self.alfa.shape, dtype=np.int64)
+        soma_maximos = np.zeros(n_experimentos)
+        soma_amostras = np.zeros(self.alfa.shape)
+        
+        for inicio in range(0, n_amostras, tamanho_bloco):
+            tamanho = min(tamanho_bloco, n_amostras - inicio)
+            amostras = self.rng.beta(self.alfa, self.beta, size=(tamanho,) + self.alfa.shape)
+            
+            melhores = np.argmax(amostras, axis=2)
+            for k in range(n_variantes):
+                vitorias[:, k] += np.count_nonzero(melhores == k, axis=0)
+            
+            # Σ (max_j p_j - p_k) = Σ max_j p_j - Σ p_k
+            soma_maximos += amostras.max(axis=2).sum(axis=0)
+            soma_amostras += amostras.sum(axis=0)
+        
+        return {
+            'prob_melhor': vitorias / n_amostras,
+            'perda_esperada': (soma_maximos[:, None] - soma_amostras) / n_amostras,
+            'media': self.media
+        }
 
 def exemplo_doenca_teste():
     """
@@ -245,16 +714,9 @@ def plotar_bayes_vs_prevalencia():
     sensibilidade = 0.95
     especificidade = 0.98
     
-    probabilidades_posteriores = []
-    
     tb = TeoremaBayes()
-    
-    for prevalencia in prevalencias:
-        prob_positivo_nao_doenca = 1 - especificidade
-        prob_positivo = (sensibilidade * prevalencia + 
-                        prob_positivo_nao_doenca * (1 - prevalencia))
-        prob_posterior = tb.calcular_bayes(prevalencia, sensibilidade, prob_positivo)
-        probabilidades_posteriores.append(prob_posterior)
+    probabilidades_posteriores = tb.calcular_bayes_completo(prevalencias, sensibilidade,
+                                                            1 - especificidade)
     
     # Cria o gráfico
     plt.figure(figsize=(10, 6))
@@ -305,6 +767,199 @@ def demonstrar_versao_completa_bayes():
     print(f"\n5. VANTAGEM DA VERSÃO COMPLETA:")
     print("   Não precisamos calcular P(B) separadamente")
     print("   A fórmula já inclui todos os cenários possíveis")
+    
+    print(f"\n6. GRADE DE PARÂMETROS (uma única chamada):")
+    prevalencias = np.linspace(0.001, 0.2, 200)[:, None, None]
+    sensibilidades = np.linspace(0.5, 0.999, 100)[None, :, None]
+    especificidades = np.linspace(0.8, 0.999, 100)[None, None, :]
+    grade = tb.calcular_bayes_completo(prevalencias, sensibilidades, 1 - especificidades)
+    print(f"   {grade.size} combinações de prevalência × sensibilidade × especificidade")
+    print(f"   Fração das combinações com P(A|B) > 50%: {np.mean(grade > 0.5):.1%}")
+
+def exemplo_multiplas_hipoteses():
+    """
+    Exemplo: qual dado gerou cada sequência de lançamentos?
+    """
+    print("\n=== MÚLTIPLAS HIPÓTESES EM ESCALA LOG ===\n")
+    
+    hipoteses = ['Honesto', 'Viciado no 6', 'Viciado no 1']
+    verossimilhancas = np.array([
+        [1/6] * 6,
+        [0.16, 0.16, 0.16, 0.16, 0.16, 0.20],
+        [0.20, 0.16, 0.16, 0.16, 0.16, 0.16],
+    ])
+    priors = np.array([0.90, 0.05, 0.05])
+    
+    # 100 mil casos; cada caso tem as contagens de 2000 lançamentos de um dos dados
+    rng = np.random.default_rng(42)
+    n_casos, n_lancamentos = 100_000, 2000
+    verdadeiros = rng.choice(3, size=n_casos, p=priors)
+    casos = np.vstack([rng.multinomial(n_lancamentos, verossimilhancas[h], size=np.sum(verdadeiros == h))
+                       for h in range(3)])
+    verdadeiros = np.sort(verdadeiros)
+    
+    print(f"1. Produto direto das verossimilhanças de um caso: "
+          f"{np.prod(verossimilhancas[0] ** casos[0]):.1e} (underflow)")
+    
+    tb = TeoremaBayes()
+    posteriores = tb.calcular_bayes_log(priors, verossimilhancas, casos)
+    acertos = np.mean(np.argmax(posteriores, axis=1) == verdadeiros)
+    
+    print(f"2. {n_casos} casos × {len(hipoteses)} hipóteses numa única chamada")
+    for h, nome in enumerate(hipoteses):
+        print(f"   Posterior média de '{nome}' nos casos gerados por ele: "
+              f"{posteriores[verdadeiros == h, h].mean():.3f}")
+    print(f"   Hipótese mais provável correta em {acertos:.2%} dos casos")
+    
+    return posteriores
+
+def exemplo_atualizacao_sequencial():
+    """
+    Exemplo: composição desconhecida de uma urna, estimada bola a bola
+    """
+    print("\n=== ATUALIZAÇÃO SEQUENCIAL (PRIORIS CONJUGADAS) ===\n")
+    
+    rng = np.random.default_rng(42)
+    
+    print("1. URNA COM FRAÇÃO DESCONHECIDA DE VERMELHAS (Beta-Binomial):")
+    posterior = PosteriorBetaBinomial(alfa=1, beta=1)
+    for n_lote in [10, 100, 1000, 100_000]:
+        posterior.atualizar(rng.random(n_lote) < 0.3)
+        inferior, superior = posterior.intervalo_credibilidade()
+        print(f"   {posterior.n_observacoes:7d} bolas: média = {posterior.media:.4f}, "
+              f"IC95% = [{inferior:.4f}, {superior:.4f}]")
+    print(f"   P(2 vermelhas nas próximas 3) = {posterior.probabilidade_preditiva(2, 3):.4f}")
+    
+    print("\n2. URNA COM QUATRO CORES (Dirichlet-Multinomial):")
+    posterior = PosteriorDirichletMultinomial(np.ones(4))
+    posterior.atualizar(rng.choice(4, size=50_000, p=[0.4, 0.3, 0.2, 0.1]))
+    intervalos = posterior.intervalo_credibilidade()
+    for cor, (media, (inferior, superior)) in enumerate(zip(posterior.media, intervalos)):
+        print(f"   Cor {cor}: média = {media:.4f}, IC95% = [{inferior:.4f}, {superior:.4f}]")
+    
+    print("\n3. MÉDIA DE UM SENSOR COM RUÍDO CONHECIDO (Normal-Normal):")
+    posterior = PosteriorNormalNormal(media_priori=0, variancia_priori=100, variancia_ruido=4)
+    posterior.atualizar(rng.normal(12.5, 2, size=10_000))
+    inferior, superior = posterior.intervalo_credibilidade()
+    print(f"   Média = {posterior.media:.4f}, IC95% = [{inferior:.4f}, {superior:.4f}]")
+    print(f"   P(próxima leitura > 15) = {posterior.probabilidade_preditiva(minimo=15):.4f}")
+    
+    return posterior
+
+def exemplo_posterior_em_grade():
+    """
+    Exemplo: composição de urnas e média/desvio de medições, estimados em grade
+    """
+    print("\n=== POSTERIOR EM GRADE ===\n")
+    
+    rng = np.random.default_rng(42)
+    tb = TeoremaBayes()
+    
+    print("1. FRAÇÃO DE VERMELHAS EM 1000 URNAS (uma única chamada, 1-D):")
+    fracoes = rng.uniform(0.01, 0.2, size=1000)
+    retiradas = rng.integers(50, 5000, size=1000)
+    vermelhas = rng.binomial(retiradas, fracoes)
+    
+    def log_binomial(parametros, dados):
+        p, = parametros
+        k, n = dados
+        return k * np.log(p) + (n - k) * np.log1p(-p)
+    
+    resultado = tb.posterior_em_grade(log_binomial, [(1e-6, 1 - 1e-6)],
+                                      (vermelhas[:, None], retiradas[:, None]), n_pontos=64)
+    
+    # Com priori uniforme a posterior exata é Beta(k + 1, n - k + 1)
+    media_exata = (vermelhas + 1) / (retiradas + 2)
+    erro = np.abs(resultado['media'][:, 0] - media_exata).max()
+    print(f"   64 pontos por urna, 2 refinamentos; maior erro da média: {erro:.1e}")
+    
+    print("\n2. MÉDIA E DESVIO DE TRÊS SÉRIES DE MEDIÇÕES (2-D):")
+    series = [rng.normal(10, 2, 500), rng.normal(-3, 0.5, 200), rng.normal(0, 5, 1000)]
+    n = np.array([len(x) for x in series])[:, None]
+    soma = np.array([x.sum() for x in series])[:, None]
+    soma_quadrados = np.array([(x ** 2).sum() for x in series])[:, None]
+    
+    def log_normal(parametros, dados):
+        mu, sigma = parametros
+        n, soma, soma_quadrados = dados
+        residuos = soma_quadrados - 2 * mu * soma + n * mu ** 2
+        return -n * np.log(sigma) - residuos / (2 * sigma ** 2)
+    
+    resultado = tb.posterior_em_grade(log_normal, [(-20, 20), (0.01, 20)],
+                                      (n, soma, soma_quadrados), n_pontos=60)
+    for x, (mu, sigma) in zip(series, resultado['media']):
+        print(f"   média ≈ {mu:7.3f} (amostral {x.mean():7.3f}), desvio ≈ {sigma:.3f} (amostral {x.std():.3f})")
+    
+    return resultado
+
+def exemplo_triagem_pacientes():
+    """
+    Exemplo: triagem em lote de pacientes com vários sintomas
+    """
+    print("\n=== TRIAGEM DE PACIENTES EM LOTE ===\n")
+    
+    diagnosticos = ['Doença A', 'Doença B', 'Doença C', 'Sem doença']
+    prevalencias = np.array([0.02, 0.01, 0.005, 0.965])
+    sintomas = ['febre', 'tosse', 'dor', 'fadiga', 'náusea']
+    verossimilhancas = np.array([
+        [0.80, 0.60, 0.20, 0.70, 0.10],
+        [0.60, 0.10, 0.70, 0.50, 0.40],
+        [0.40, 0.30, 0.30, 0.90, 0.60],
+        [0.05, 0.10, 0.08, 0.15, 0.03],
+    ])
+    diagnostico = DiagnosticoBayesiano(prevalencias, verossimilhancas, diagnosticos, sintomas)
+    
+    print("1. UM SINTOMA (febre), como no exemplo de diagnóstico médico:")
+    so_febre = DiagnosticoBayesiano(prevalencias, verossimilhancas[:, :1], diagnosticos)
+    for nome, prob in zip(diagnosticos, so_febre.pontuar(np.array([True]))):
+        print(f"   P({nome} | febre) = {prob:.1%}")
+    
+    print("\n2. UM MILHÃO DE PACIENTES, CINCO SINTOMAS:")
+    rng = np.random.default_rng(42)
+    n = 1_000_000
+    verdadeiros = rng.choice(len(diagnosticos), size=n, p=prevalencias)
+    pacientes = rng.random((n, len(sintomas))) < verossimilhancas[verdadeiros]
+    
+    resultado = diagnostico.triagem(pacientes)
+    for d, nome in enumerate(diagnosticos[:3]):
+        suspeitos = resultado['indice'] == d
+        print(f"   {nome}: {suspeitos.sum():6d} pacientes com maior posterior, "
+              f"{np.mean(verdadeiros[suspeitos] == d):.1%} deles realmente doentes")
+    
+    return resultado
+
+def exemplo_teste_ab():
+    """
+    Exemplo: centenas de testes A/B/C atualizados ao mesmo tempo
+    """
+    print("\n=== TESTES A/B/n BAYESIANOS ===\n")
+    
+    rng = np.random.default_rng(42)
+    n_experimentos, n_variantes = 300, 3
+    taxas = rng.uniform(0.02, 0.06, size=(n_experimentos, n_variantes))
+    
+    teste = TesteABBayesiano(n_variantes, n_experimentos, semente=42)
+    visitantes = rng.integers(1000, 20000, size=(n_experimentos, n_variantes))
+    teste.atualizar(rng.binomial(visitantes, taxas), visitantes)
+    
+    resultado = teste.comparar(n_amostras=20000)
+    
+    print("1. PRIMEIRO EXPERIMENTO:")
+    intervalos = teste.intervalo_credibilidade()[0]
+    for k, nome in enumerate(['A', 'B', 'C']):
+        print(f"   {nome}: taxa ≈ {resultado['media'][0, k]:.4f} "
+              f"[{intervalos[k, 0]:.4f}, {intervalos[k, 1]:.4f}], "
+              f"P(melhor) = {resultado['prob_melhor'][0, k]:.3f}, "
+              f"perda esperada = {resultado['perda_esperada'][0, k]:.5f}")
+    
+    print(f"\n2. TODOS OS {n_experimentos} EXPERIMENTOS:")
+    decididos = resultado['prob_melhor'].max(axis=1) > 0.95
+    escolhas = np.argmax(resultado['prob_melhor'], axis=1)
+    acertos = escolhas[decididos] == np.argmax(taxas[decididos], axis=1)
+    print(f"   Com P(melhor) > 95%: {decididos.sum()} experimentos, "
+          f"variante escolhida correta em {acertos.mean():.1%} deles")
+    
+    return resultado
 
 if __name__ == "__main__":
     # Executa todos os exemplos
@@ -316,3 +971,8 @@ if __name__ == "__main__":
     # Visualizações
     plotar_bayes_vs_prevalencia()
     demonstrar_versao_completa_bayes()
+    exemplo_multiplas_hipoteses()
+    exemplo_atualizacao_sequencial()
+    exemplo_posterior_em_grade()
+    exemplo_triagem_pacientes()
+    exemplo_teste_ab()
@@ -9,16 +9,112 @@ Telefones: (11) 98801-0667 | (92) 98456-1928
 Data: Setembro 2025
 """
 
-import random
+from math import comb
+import numpy as np
 import matplotlib.pyplot as plt
-from collections import Counter
+from collections import Counter, OrderedDict
+
+# Número de bits 1 em cada byte, para contagem de bits sem np.bitwise_count
+_BITS_POR_BYTE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+# Máximo de funções de evento nomeadas mantidas no cache de máscaras
+_MAX_EVENTOS_EM_CACHE = 128
+
+def contar_bits(mascaras):
+    """
+    Conta os bits 1 de cada máscara (int Python ou array NumPy de uint64)
+    """
+    if isinstance(mascaras, int):
+        return bin(mascaras).count('1')
+    
+    mascaras = np.ascontiguousarray(mascaras, dtype=np.uint64)
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(mascaras).astype(np.int64)
+    
+    # NumPy < 2.0: soma a contagem de cada um dos 8 bytes
+    bytes_mascaras = mascaras.view(np.uint8).reshape(mascaras.shape + (8,))
+    return _BITS_POR_BYTE[bytes_mascaras].sum(axis=-1, dtype=np.int64)
+
+def _combinacoes(n, r):
+    """
+    Todas as combinações de r elementos de range(n), em ordem lexicográfica, numa matriz (C(n, r), r)
+    
+    Cada coluna é gerada a partir da anterior: a linha que termina em u é
+    repetida uma vez para cada próximo elemento possível, u + 1 .. n - r + t.
+    """
+    tabela = np.empty((1, 0), dtype=np.min_scalar_type(n))
+    for t in range(r):
+        ultimos = tabela[:, -1].astype(np.int64) if t else np.full(1, -1)
+        quantidades = n - r + t - ultimos
+        inicios = np.cumsum(quantidades) - quantidades
+        novos = np.arange(quantidades.sum()) + np.repeat(ultimos + 1 - inicios, quantidades)
+        tabela = np.column_stack([np.repeat(tabela, quantidades, axis=0), novos.astype(tabela.dtype)])
+    return tabela
+
+def _blocos_combinacoes(n, r, tamanho_bloco, elementos=None):
+    """
+    Gera as combinações de r elementos de range(n) em ordem lexicográfica, em blocos de cerca de tamanho_bloco linhas
+    
+    As últimas s posições vêm de uma tabela fixa com as C(n, s) <= tamanho_bloco
+    combinações de s elementos: as que começam depois de u formam o final
+    dessa tabela, com C(n - 1 - u, s) linhas. Os prefixos de r - s elementos
+    (todos menores que n - s) são gerados recursivamente, também em blocos,
+    e cada bloco de saída é montado só com np.repeat e np.take, coluna a
+    coluna (o bloco (linhas, r) é a transposta de um array contíguo).
+    
+    elementos: array com n valores; as combinações são de elementos[i] em
+    vez dos próprios índices i.
+    """
+    if elementos is None:
+        elementos = np.arange(n, dtype=np.min_scalar_type(n))
+    if r == 0:
+        yield np.empty((1, 0), dtype=elementos.dtype)
+        return
+    
+    s = 1
+    while s < r and comb(n, s + 1) <= tamanho_bloco:
+        s += 1
+    sufixos = np.ascontiguousarray(elementos[_combinacoes(n, s)].T)
+    # Número de sufixos que começam depois de u, indexado por u + 1 (u = -1: sem prefixo)
+    n_sufixos = np.array([comb(n - 1 - u, s) for u in range(-1, n)], dtype=np.int64)
+    
+    for prefixos in _blocos_combinacoes(n - s, r - s, tamanho_bloco):
+        ultimos = prefixos[:, -1].astype(np.int64) if r > s else np.full(len(prefixos), -1)
+        valores_prefixos = np.ascontiguousarray(elementos[prefixos].T)
+        quantidades = n_sufixos[ultimos + 1]
+        acumuladas = np.cumsum(quantidades)
+        
+        inicio = 0
+        while inicio < len(prefixos):
+            base = acumuladas[inicio - 1] if inicio else 0
+            fim = max(int(np.searchsorted(acumuladas, base + tamanho_bloco, side='right')), inicio + 1)
+            grupo = quantidades[inicio:fim]
+            inicios = acumuladas[inicio:fim] - grupo - base
+            
+            bloco = np.empty((r, acumuladas[fim - 1] - base), dtype=elementos.dtype)
+            for j in range(r - s):
+                bloco[j] = np.repeat(valores_prefixos[j, inicio:fim], grupo)
+            # Cada prefixo recebe as últimas linhas da tabela de sufixos
+            linhas = np.arange(bloco.shape[1]) + np.repeat(sufixos.shape[1] - grupo - inicios, grupo)
+            for j in range(s):
+                np.take(sufixos[j], linhas, out=bloco[r - s + j])
+            yield bloco.T
+            inicio = fim
 
 class Baralho:
     """
     Classe que representa um baralho de 52 cartas
+    
+    Cada carta tem um código inteiro 0–51 (naipe * 13 + valor, na ordem de
+    self.cartas) e o conjunto de cartas restantes é uma máscara de 52 bits.
+    Eventos são compilados uma única vez em máscaras de bits, então
+    probabilidades, interseções e uniões viram contagens de bits.
+    
+    As contagens de cartas restantes por valor e por naipe são atualizadas
+    a cada saque, então a probabilidade da próxima carta é O(1).
     """
     
-    def __init__(self):
+    def __init__(self, semente=None):
         self.naipes = ['copas', 'ouros', 'espadas', 'paus']
         self.valores = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
         self.cartas = []
@@ -31,12 +127,78 @@ class Baralho:
                 self.cartas.append((valor, naipe))
         
         self.cartas_restantes = self.cartas.copy()
+        self.rng = np.random.default_rng(semente)
+        
+        # Representação inteira
+        self.codigos_cartas = {carta: codigo for codigo, carta in enumerate(self.cartas)}
+        self.mascara_completa = (1 << len(self.cartas)) - 1
+        self.mascara_restantes = self.mascara_completa
+        self._mascaras_eventos = OrderedDict()
+        
+        # Contagens incrementais das cartas restantes
+        self.contagem_valores = np.full(len(self.valores), len(self.naipes), dtype=np.int64)
+        self.contagem_naipes = np.full(len(self.naipes), len(self.valores), dtype=np.int64)
+    
+    def codificar_carta(self, carta):
+        """
+        Converte uma carta (valor, naipe) no seu código 0–51
+        """
+        return self.codigos_cartas[carta]
+    
+    def decodificar_carta(self, codigo):
+        """
+        Converte um código 0–51 na carta (valor, naipe)
+        """
+        return self.cartas[codigo]
+    
+    def compilar_evento(self, evento):
+        """
+        Compila um evento em máscara de 52 bits (bit i = carta de código i)
+        
+        evento: função que recebe uma carta e retorna True/False, ou uma
+        máscara já compilada (int). Funções nomeadas ficam em cache pela
+        identidade do objeto (no máximo _MAX_EVENTOS_EM_CACHE, descartando a
+        menos usada), então devem ser puras: uma função que depende de estado
+        mutável devolve a máscara da primeira compilação. Lambdas não entram
+        no cache, pois cada chamada costuma criar uma nova.
+        """
+        if isinstance(evento, (int, np.integer)):
+            return int(evento)
+        
+        if evento in self._mascaras_eventos:
+            self._mascaras_eventos.move_to_end(evento)
+            return self._mascaras_eventos[evento]
+        
+        mascara = 0
+        for codigo, carta in enumerate(self.cartas):
+            if evento(carta):
+                mascara |= 1 << codigo
+        
+        if getattr(evento, '__name__', '<lambda>') != '<lambda>':
+            self._mascaras_eventos[evento] = mascara
+            if len(self._mascaras_eventos) > _MAX_EVENTOS_EM_CACHE:
+                self._mascaras_eventos.popitem(last=False)
+        
+        return mascara
+    
+    def mascara_naipe(self, naipe):
+        """
+        Máscara das 13 cartas de um naipe
+        """
+        return ((1 << len(self.valores)) - 1) << (self.naipes.index(naipe) * len(self.valores))
+    
+    def mascara_valor(self, valor):
+        """
+        Máscara das 4 cartas de um valor
+        """
+        indice = self.valores.index(valor)
+        return sum(1 << (n * len(self.valores) + indice) for n in range(len(self.naipes)))
     
     def embaralhar(self):
         """
         Embaralha o baralho
         """
-        random.shuffle(self.cartas_restantes)
+        self.rng.shuffle(self.cartas_restantes)
     
     def sacar_carta(self):
         """
@@ -47,6 +209,9 @@ class Baralho:
         
         carta = self.cartas_restantes.pop()
         self.cartas_sacadas.append(carta)
+        self.mascara_restantes &= ~(1 << self.codigos_cartas[carta])
+        self.contagem_valores[self.valores.index(carta[0])] -= 1
+        self.contagem_naipes[self.naipes.index(carta[1])] -= 1
         return carta
     
     def sacar_multiplas_cartas(self, n):
@@ -58,21 +223,228 @@ class Baralho:
             cartas.append(self.sacar_carta())
         return cartas
     
+    def embaralhar_lote(self, n_baralhos, n_posicoes=None, cartas=None):
+        """
+        Embaralha n_baralhos de uma só vez (Fisher–Yates vetorizado)
+        
+        Retorna uma matriz (n_baralhos, 52) de códigos int8, uma linha por
+        baralho. Com n_posicoes, só as primeiras n_posicoes de cada linha
+        são sorteadas (o restante fica sem ordem definida), o que basta
+        para sacar as primeiras cartas e poupa trocas. cartas restringe o
+        embaralhamento a um subconjunto de códigos (ex.: cartas não vistas).
+        """
+        if cartas is None:
+            cartas = np.arange(len(self.cartas))
+        total = len(cartas)
+        if n_posicoes is None:
+            n_posicoes = total
+        
+        baralhos = np.tile(np.asarray(cartas, dtype=np.int8), (n_baralhos, 1))
+        linhas = np.arange(n_baralhos)
+        
+        # A posição i troca com uma posição j sorteada em [i, total), em todas as linhas
+        for i in range(min(n_posicoes, total - 1)):
+            j = self.rng.integers(i, total, size=n_baralhos)
+            escolhidas = baralhos[linhas, j]
+            baralhos[linhas, j] = baralhos[:, i]
+            baralhos[:, i] = escolhidas
+        
+        return baralhos
+    
+    def sacar_lote(self, n_baralhos, n_cartas, cartas=None):
+        """
+        Saca as primeiras n_cartas de n_baralhos embaralhados independentemente
+        
+        Retorna uma matriz (n_baralhos, n_cartas) de códigos int8.
+        """
+        total = len(self.cartas) if cartas is None else len(cartas)
+        if not 0 <= n_cartas <= total:
+            raise ValueError(f"É possível sacar de 0 a {total} cartas")
+        
+        return self.embaralhar_lote(n_baralhos, n_cartas, cartas)[:, :n_cartas]
+    
+    def mascaras_restantes_lote(self, cartas_sacadas):
+        """
+        Converte uma matriz de cartas sacadas (códigos) nas máscaras uint64 das cartas restantes
+        """
+        bits = np.left_shift(np.uint64(1), np.asarray(cartas_sacadas, dtype=np.uint64))
+        sacadas = np.bitwise_or.reduce(bits, axis=-1)
+        return np.uint64(self.mascara_completa) & ~sacadas
+    
     def resetar_baralho(self):
         """
         Reseta o baralho para o estado inicial
         """
         self.cartas_restantes = self.cartas.copy()
         self.cartas_sacadas = []
+        self.mascara_restantes = self.mascara_completa
+        self.contagem_valores[:] = len(self.naipes)
+        self.contagem_naipes[:] = len(self.valores)
         self.embaralhar()
     
     def probabilidade_evento(self, evento):
         """
         Calcula a probabilidade de um evento específico
         evento: função que retorna True se a carta satisfaz o evento
+        (ou máscara compilada)
+        """
+        return contar_bits(self.compilar_evento(evento)) / len(self.cartas)
+    
+    def probabilidade_intersecao(self, *eventos):
+        """
+        Calcula P(E1 ∩ E2 ∩ ...) com um AND das máscaras
+        """
+        mascara = self.mascara_completa
+        for evento in eventos:
+            mascara &= self.compilar_evento(evento)
+        return contar_bits(mascara) / len(self.cartas)
+    
+    def probabilidade_uniao(self, *eventos):
+        """
+        Calcula P(E1 ∪ E2 ∪ ...) com um OR das máscaras
         """
-        cartas_favoraveis = [carta for carta in self.cartas if evento(carta)]
-        return len(cartas_favoraveis) / len(self.cartas)
+        mascara = 0
+        for evento in eventos:
+            mascara |= self.compilar_evento(evento)
+        return contar_bits(mascara) / len(self.cartas)
+    
+    def probabilidade_evento_estados(self, evento, estados):
+        """
+        Probabilidade do evento na próxima carta para vários estados do baralho
+        
+        estados: array de máscaras uint64 (cartas restantes de cada baralho).
+        Retorna um array com P(evento) em cada estado (NaN se vazio).
+        """
+        estados = np.asarray(estados, dtype=np.uint64)
+        mascara = np.uint64(self.compilar_evento(evento))
+        favoraveis = contar_bits(estados & mascara)
+        totais = contar_bits(estados)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return favoraveis / totais
+    
+    def favoraveis_restantes(self, evento):
+        """
+        Número de cartas restantes que satisfazem o evento
+        
+        evento: um valor ('A', ..., 'K') ou naipe ('copas', ...), lidos
+        direto das contagens incrementais, ou função/máscara de evento.
+        """
+        if isinstance(evento, str):
+            if evento in self.valores:
+                return int(self.contagem_valores[self.valores.index(evento)])
+            if evento in self.naipes:
+                return int(self.contagem_naipes[self.naipes.index(evento)])
+            raise ValueError(f"'{evento}' não é um valor nem um naipe")
+        
+        return contar_bits(self.compilar_evento(evento) & self.mascara_restantes)
+    
+    def probabilidade_proxima_carta(self, evento):
+        """
+        Probabilidade de a próxima carta sacada satisfazer o evento
+        """
+        n_restantes = len(self.cartas_restantes)
+        if n_restantes == 0:
+            return 0
+        return self.favoraveis_restantes(evento) / n_restantes
+    
+    def probabilidade_pelo_menos(self, evento, j, k):
+        """
+        P(pelo menos j cartas do evento entre as próximas k), sem simulação
+        
+        Segue a distribuição hipergeométrica: das N cartas restantes, K
+        satisfazem o evento, e k são sacadas sem reposição.
+        """
+        N = len(self.cartas_restantes)
+        if not 0 <= k <= N:
+            raise ValueError(f"É possível sacar de 0 a {N} cartas")
+        
+        K = self.favoraveis_restantes(evento)
+        casos_favoraveis = sum(comb(K, i) * comb(N - K, k - i)
+                               for i in range(max(j, 0), min(k, K) + 1))
+        return casos_favoraveis / comb(N, k)
+    
+    def _codigos_disponiveis(self, restantes):
+        """
+        Códigos das cartas consideradas: baralho completo ou só as restantes
+        """
+        mascara = self.mascara_restantes if restantes else self.mascara_completa
+        return [codigo for codigo in range(len(self.cartas)) if mascara >> codigo & 1]
+    
+    def probabilidade_mao(self, n_cartas, condicao, eventos=None, restantes=False,
+                          tamanho_bloco=1 << 18):
+        """
+        Probabilidade exata de uma mão de n_cartas (sem reposição) satisfazer a condição
+        
+        Com eventos=[E1, ..., Em] (funções ou máscaras de uma carta),
+        condicao recebe as quantidades de cartas de cada evento na mão, ex.:
+        eventos=[copas, figura], condicao=lambda c, f: c >= 2 and f >= 1.
+        O baralho é dividido nas células das interseções dos eventos e a
+        contagem é feita pela hipergeométrica multivariada, sem enumerar mãos.
+        
+        Sem eventos, condicao recebe uma matriz (n_maos, n_cartas) de códigos
+        e retorna um array booleano; as mãos são então enumeradas em blocos
+        de tamanho_bloco e avaliadas de forma vetorizada.
+        
+        restantes=True considera apenas as cartas ainda no baralho.
+        """
+        disponiveis = self._codigos_disponiveis(restantes)
+        if not 0 <= n_cartas <= len(disponiveis):
+            raise ValueError(f"É possível formar mãos de 0 a {len(disponiveis)} cartas")
+        
+        total = comb(len(disponiveis), n_cartas)
+        if eventos is None:
+            return self._contar_maos_enumerando(disponiveis, n_cartas, condicao,
+                                                tamanho_bloco) / total
+        
+        return self._contar_maos_por_celulas(disponiveis, n_cartas, condicao, eventos) / total
+    
+    def _contar_maos_por_celulas(self, disponiveis, n_cartas, condicao, eventos):
+        """
+        Número de mãos favoráveis pela hipergeométrica multivariada
+        
+        Cada célula reúne as cartas com o mesmo padrão de pertinência aos
+        eventos; uma mão é descrita por quantas cartas tira de cada célula.
+        """
+        mascaras = [self.compilar_evento(evento) for evento in eventos]
+        tamanhos = Counter(tuple(mascara >> codigo & 1 for mascara in mascaras)
+                           for codigo in disponiveis)
+        celulas = list(tamanhos.items())
+        
+        favoraveis = 0
+        
+        def distribuir(indice, restantes, contagens, maneiras):
+            nonlocal favoraveis
+            if indice == len(celulas) - 1:
+                padrao, tamanho = celulas[indice]
+                if restantes > tamanho:
+                    return
+                contagens = [c + restantes * bit for c, bit in zip(contagens, padrao)]
+                if condicao(*contagens):
+                    favoraveis += maneiras * comb(tamanho, restantes)
+                return
+            
+            padrao, tamanho = celulas[indice]
+            for tiradas in range(min(restantes, tamanho) + 1):
+                novas = [c + tiradas * bit for c, bit in zip(contagens, padrao)]
+                distribuir(indice + 1, restantes - tiradas, novas,
+                           maneiras * comb(tamanho, tiradas))
+        
+        distribuir(0, n_cartas, [0] * len(mascaras), 1)
+        return favoraveis
+    
+    def _contar_maos_enumerando(self, disponiveis, n_cartas, condicao, tamanho_bloco):
+        """
+        Número de mãos favoráveis enumerando todas as combinações em blocos
+        
+        Os blocos de combinações são gerados no NumPy (_blocos_combinacoes),
+        sem criar uma tupla Python por mão.
+        """
+        codigos = np.asarray(disponiveis, dtype=np.int8)
+        favoraveis = 0
+        for maos in _blocos_combinacoes(len(codigos), n_cartas, tamanho_bloco, codigos):
+            favoraveis += int(np.count_nonzero(condicao(maos)))
+        return favoraveis
     
     def probabilidade_empirica(self, evento, n_sorteios=None):
         """
@@ -149,6 +521,10 @@ def demonstrar_eventos_baralho():
     print(f"   E = 'Sair Ás de copas'")
     print(f"   P(E) = {prob_as_copas:.3f}")
     
+    # Interseção e união a partir das máscaras já compiladas
+    print(f"   P(A ∩ B) = {baralho.probabilidade_intersecao(evento_as, evento_copas):.3f}")
+    print(f"   P(A ∪ B) = {baralho.probabilidade_uniao(evento_as, evento_copas):.3f}")
+    
     print("\n3. SIMULAÇÃO DE SORTEIOS:")
     baralho.resetar_baralho()
     n_sorteios = 20  # Sorteia 20 cartas
@@ -185,9 +561,9 @@ def demonstrar_sorteio_sem_reposicao():
     def evento_as(carta):
         return carta[0] == 'A'
     
-    # Conta quantos Áses restam
-    ases_restantes = sum(1 for carta in baralho.cartas_restantes if evento_as(carta))
-    prob_segunda_carta_as = ases_restantes / len(baralho.cartas_restantes)
+    # Áses restantes, lidos das contagens incrementais do baralho
+    ases_restantes = baralho.favoraveis_restantes('A')
+    prob_segunda_carta_as = baralho.probabilidade_proxima_carta('A')
     
     print(f"   Áses restantes: {ases_restantes}")
     print(f"   Cartas restantes: {len(baralho.cartas_restantes)}")
@@ -209,12 +585,15 @@ def demonstrar_sorteio_sem_reposicao():
         cartas_sacadas.append(carta)
         
         # Calcula probabilidade de Ás nas cartas restantes
-        ases_restantes = sum(1 for carta in baralho.cartas_restantes if evento_as(carta))
-        prob_as_restante = ases_restantes / len(baralho.cartas_restantes) if baralho.cartas_restantes else 0
+        prob_as_restante = baralho.probabilidade_proxima_carta(evento_as)
         probabilidades_as.append(prob_as_restante)
         
         print(f"   Carta {i+1}: {carta} | P(próximo Ás) = {prob_as_restante:.3f}")
     
+    print("\n3. PROBABILIDADE EXATA (HIPERGEOMÉTRICA):")
+    prob_algum_as = baralho.probabilidade_pelo_menos('A', 1, 5)
+    print(f"   P(pelo menos 1 Ás nas próximas 5 cartas) = {prob_algum_as:.3f}")
+    
     return cartas_sacadas, probabilidades_as
 
 def plotar_distribuicao_naipes():
@@ -225,15 +604,15 @@ def plotar_distribuicao_naipes():
     
     baralho = Baralho()
     n_simulacoes = 1000
-    resultados_naipes = []
     
-    for _ in range(n_simulacoes):
-        baralho.resetar_baralho()
-        carta = baralho.sacar_carta()
-        resultados_naipes.append(carta[1])
+    # Embaralha todos os baralhos de uma vez e saca a primeira carta de cada
+    primeiras_cartas = baralho.sacar_lote(n_simulacoes, 1)[:, 0]
+    naipes_sorteados = primeiras_cartas // len(baralho.valores)
     
     # Conta os resultados
-    contagem_naipes = Counter(resultados_naipes)
+    frequencias = np.bincount(naipes_sorteados, minlength=len(baralho.naipes))
+    contagem_naipes = Counter({naipe: int(freq)
+                               for naipe, freq in zip(baralho.naipes, frequencias)})
     
     # Cria o gráfico
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
@@ -263,6 +642,42 @@ def plotar_distribuicao_naipes():
     print(f"Distribuição observada: {dict(contagem_naipes)}")
     print("Teoricamente, cada naipe deveria aparecer 25% das vezes")
 
+def demonstrar_maos_exatas():
+    """
+    Demonstra probabilidades exatas de eventos com várias cartas
+    """
+    print("\n=== DEMONSTRAÇÃO: MÃOS DE 5 CARTAS (CÁLCULO EXATO) ===\n")
+    
+    baralho = Baralho()
+    
+    def evento_copas(carta):
+        return carta[1] == 'copas'
+    
+    def evento_figura(carta):
+        return carta[0] in ['J', 'Q', 'K']
+    
+    print("1. CONTAGEM POR CATEGORIAS (HIPERGEOMÉTRICA MULTIVARIADA):")
+    prob = baralho.probabilidade_mao(5, lambda copas, figuras: copas >= 2 and figuras >= 1,
+                                     eventos=[evento_copas, evento_figura])
+    print(f"   P(pelo menos 2 copas e 1 figura) = {prob:.4f}")
+    
+    prob_flush = baralho.probabilidade_mao(
+        5, lambda *por_naipe: max(por_naipe) == 5,
+        eventos=[baralho.mascara_naipe(naipe) for naipe in baralho.naipes])
+    print(f"   P(5 cartas do mesmo naipe) = {prob_flush:.6f}")
+    
+    print("\n2. ENUMERAÇÃO VETORIZADA (EVENTO NÃO DECOMPONÍVEL):")
+    
+    # Sequência (5 valores consecutivos, Ás baixo): condição sobre a mão inteira
+    def sequencia(maos):
+        valores = np.sort(maos % len(baralho.valores), axis=1)
+        return np.all(np.diff(valores, axis=1) == 1, axis=1)
+    
+    prob_sequencia = baralho.probabilidade_mao(5, sequencia)
+    print(f"   P(sequência, Ás baixo) = {prob_sequencia:.6f}")
+    
+    return prob, prob_flush, prob_sequencia
+
 if __name__ == "__main__":
     # Executa as demonstrações
     baralho = demonstrar_eventos_baralho()
@@ -270,5 +685,8 @@ if __name__ == "__main__":
     # Demonstra sorteio sem reposição
     cartas, probs = demonstrar_sorteio_sem_reposicao()
     
+    # Probabilidades exatas com várias cartas
+    demonstrar_maos_exatas()
+    
     # Plota distribuição de naipes
     plotar_distribuicao_naipes()
@@ -9,36 +9,209 @@ Telefones: (11) 98801-0667 | (92) 98456-1928
 Data: Setembro 2025
 """
 
-import random
+import os
+import sys
+import numpy as np
 import matplotlib.pyplot as plt
 from collections import Counter
+from functools import lru_cache
+
+# Permite importar os módulos do repositório também ao executar este arquivo diretamente
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from exemplos_basicos.historico import HistoricoAmostral
 
 class Dado:
     """
     Classe que representa um dado de 6 faces e suas operações probabilísticas
+    
+    pesos: pesos relativos de cada face (dado viciado); None = dado honesto.
+    Dados viciados são sorteados em lote por uma tabela de alias de Walker,
+    com custo O(1) por lançamento e sem laços em Python.
+    janela: se definida, guarda só os últimos lançamentos num buffer
+    circular (memória fixa); as contagens totais continuam exatas.
+    tamanho_amostra: mantém uma amostra uniforme (por reservatório)
+    de todos os lançamentos já feitos.
     """
     
-    def __init__(self, faces=6):
+    def __init__(self, faces=6, pesos=None, semente=None, janela=None, tamanho_amostra=0):
         self.faces = faces
         self.espaco_amostral = list(range(1, faces + 1))
-        self.historico = []
+        self.rng = np.random.default_rng(semente)
+        self._historico = HistoricoAmostral(faces, janela, tamanho_amostra, self.rng)
+        
+        if pesos is None:
+            self.honesto = True
+            self.probabilidades = np.full(faces, 1 / faces)
+        else:
+            pesos = np.asarray(pesos, dtype=np.float64)
+            if pesos.shape != (faces,):
+                raise ValueError(f"São necessários {faces} pesos, um por face")
+            if np.any(pesos < 0) or pesos.sum() <= 0:
+                raise ValueError("Os pesos devem ser não negativos e com soma positiva")
+            self.honesto = False
+            self.probabilidades = pesos / pesos.sum()
+            self._limiar, self._alias = self._construir_tabela_alias(self.probabilidades)
+    
+    @staticmethod
+    def _construir_tabela_alias(probabilidades):
+        """
+        Constrói a tabela de alias de Walker (método de Vose)
+        
+        Cada coluna i guarda um limiar e um alias: sorteada a coluna i de
+        forma uniforme, o resultado é i com probabilidade limiar[i] e
+        alias[i] caso contrário.
+        """
+        n = len(probabilidades)
+        escalonadas = probabilidades * n
+        limiar = np.ones(n)
+        alias = np.arange(n)
+        
+        pequenas = [i for i in range(n) if escalonadas[i] < 1]
+        grandes = [i for i in range(n) if escalonadas[i] >= 1]
+        
+        while pequenas and grandes:
+            pequena = pequenas.pop()
+            grande = grandes.pop()
+            limiar[pequena] = escalonadas[pequena]
+            alias[pequena] = grande
+            
+            escalonadas[grande] -= 1 - escalonadas[pequena]
+            if escalonadas[grande] < 1:
+                pequenas.append(grande)
+            else:
+                grandes.append(grande)
+        
+        # O que sobra (por arredondamento) fica com limiar 1
+        return limiar, alias
+    
+    def _sortear_codigos(self, n):
+        """
+        Sorteia n códigos de face (0..faces-1) de uma só vez
+        """
+        dtype = self._historico.dtype
+        if self.honesto:
+            return self.rng.integers(0, self.faces, size=n, dtype=dtype)
+        
+        # Um único uniforme por lançamento: a parte inteira escolhe a coluna
+        # da tabela e a parte fracionária decide entre a coluna e seu alias
+        u = self.rng.random(n) * self.faces
+        colunas = u.astype(np.intp)
+        np.minimum(colunas, self.faces - 1, out=colunas)
+        u -= colunas
+        codigos = np.where(u < self._limiar[colunas], colunas, self._alias[colunas])
+        return codigos.astype(dtype)
+    
+    @property
+    def historico(self):
+        """
+        Faces dos lançamentos retidos, em ordem cronológica
+        """
+        return (self._historico.codigos.astype(np.int64) + 1).tolist()
+    
+    @historico.setter
+    def historico(self, resultados):
+        self.limpar_historico()
+        self._historico.registrar(np.asarray(resultados, dtype=np.int64) - 1)
+    
+    @property
+    def n_lancamentos(self):
+        """
+        Número total de lançamentos feitos desde a última limpeza
+        """
+        return self._historico.n_total
+    
+    @property
+    def contagens(self):
+        """
+        Contagem exata de cada face em todos os lançamentos
+        """
+        return dict(zip(self.espaco_amostral, self._historico.contagens.tolist()))
+    
+    @property
+    def amostra(self):
+        """
+        Amostra uniforme dos lançamentos (requer tamanho_amostra > 0)
+        """
+        return (self._historico.amostra.astype(np.int64) + 1).tolist()
+    
+    def limpar_historico(self):
+        """
+        Descarta todos os lançamentos registrados
+        """
+        self._historico.limpar()
     
     def lancar(self):
         """
         Lança o dado e retorna o resultado
         """
-        resultado = random.choice(self.espaco_amostral)
-        self.historico.append(resultado)
-        return resultado
+        codigo = int(self._sortear_codigos(1)[0])
+        self._historico.registrar([codigo])
+        return codigo + 1
+    
+    def lancar_lote(self, n):
+        """
+        Lança o dado n vezes de uma só vez e retorna as faces como array
+        """
+        if n < 0:
+            raise ValueError("O número de lançamentos deve ser não negativo")
+        
+        codigos = self._sortear_codigos(n)
+        self._historico.registrar(codigos)
+        return codigos.astype(np.min_scalar_type(self.faces)) + 1
+    
+    def lancar_em_blocos(self, n, tamanho_bloco=1 << 22):
+        """
+        Lança o dado n vezes em blocos de tamanho fixo, sem devolver os resultados
+        
+        Útil para bilhões de lançamentos: a memória usada é a de um bloco
+        (mais o histórico, limitado se houver janela). Retorna a contagem
+        de cada face nestes n lançamentos.
+        """
+        contagens = np.zeros(self.faces, dtype=np.int64)
+        restantes = n
+        while restantes > 0:
+            tamanho = min(restantes, tamanho_bloco)
+            codigos = self._sortear_codigos(tamanho)
+            self._historico.registrar(codigos)
+            contagens += np.bincount(codigos, minlength=self.faces)
+            restantes -= tamanho
+        return dict(zip(self.espaco_amostral, contagens.tolist()))
     
     def lancar_multiplas_vezes(self, n):
         """
         Lança o dado n vezes e retorna os resultados
         """
-        resultados = []
-        for _ in range(n):
-            resultados.append(self.lancar())
-        return resultados
+        return self.lancar_lote(n).tolist()
+    
+    def contagem_acumulada(self, face):
+        """
+        Retorna o número de ocorrências da face após cada lançamento retido
+        """
+        return self._historico.contagem_acumulada(face - 1)
+    
+    @property
+    def configuracao(self):
+        """
+        Identificação imutável do dado (probabilidade de cada face), usada como chave de cache
+        """
+        return tuple(self.probabilidades.tolist())
+    
+    def distribuicao_soma(self, n_dados=1):
+        """
+        Distribuição exata da soma de n_dados lançamentos deste dado
+        
+        Retorna (somas, probabilidades) como arrays NumPy.
+        """
+        return distribuicao_soma([self] * n_dados)
+    
+    def probabilidade_soma(self, n_dados, minimo=None, maximo=None):
+        """
+        Probabilidade exata de minimo <= soma <= maximo para n_dados deste dado
+        
+        Veja a precisão em probabilidade_soma (função do módulo).
+        """
+        return probabilidade_soma([self] * n_dados, minimo, maximo)
     
     def probabilidade_evento(self, evento):
         """
@@ -53,26 +226,34 @@ class Dado:
             if elemento not in self.espaco_amostral:
                 raise ValueError(f"Elemento {elemento} não está no espaço amostral")
         
-        return len(evento) / len(self.espaco_amostral)
+        if self.honesto:
+            return len(evento) / len(self.espaco_amostral)
+        
+        # Dado viciado: soma as probabilidades das faces do evento
+        return float(sum(self.probabilidades[face - 1] for face in set(evento)))
     
     def probabilidade_empirica(self, evento, n_lancamentos=None):
         """
         Calcula a probabilidade empírica de um evento
         """
+        if not isinstance(evento, list):
+            evento = [evento]
+        
         if n_lancamentos is None:
-            n_lancamentos = len(self.historico)
+            if self.n_lancamentos == 0:
+                return 0
+            
+            # Todos os lançamentos: usa as contagens exatas
+            contagens = self.contagens
+            return sum(contagens.get(face, 0) for face in evento) / self.n_lancamentos
         
         if n_lancamentos == 0:
             return 0
         
-        if not isinstance(evento, list):
-            evento = [evento]
-        
-        # Usa apenas os últimos n_lancamentos
-        historico_recente = self.historico[-n_lancamentos:]
-        
-        # Conta quantas vezes o evento ocorreu
-        ocorrencias = sum(1 for resultado in historico_recente if resultado in evento)
+        # Usa apenas os últimos n_lancamentos, somando as contagens de cada face
+        n_disponiveis = min(n_lancamentos, self.n_lancamentos)
+        ocorrencias = sum(self._historico.contagem_recente(face - 1, n_disponiveis)
+                          for face in set(evento) if face in self.espaco_amostral)
         
         return ocorrencias / n_lancamentos
     
@@ -81,7 +262,7 @@ class Dado:
         Plota os resultados de múltiplos lançamentos
         """
         # Limpa o histórico e faz novos lançamentos
-        self.historico = []
+        self.limpar_historico()
         resultados = self.lancar_multiplas_vezes(n_lancamentos)
         
         # Conta os resultados
@@ -107,14 +288,19 @@ class Dado:
                     str(valor), ha='center', va='bottom')
         
         # Gráfico de probabilidade empírica ao longo do tempo
-        probabilidades_face_1 = []
-        for i in range(1, n_lancamentos + 1):
-            prob = self.probabilidade_empirica(1, i)
-            probabilidades_face_1.append(prob)
-        
-        ax2.plot(range(1, n_lancamentos + 1), probabilidades_face_1, 'b-', alpha=0.7)
-        ax2.axhline(y=1/self.faces, color='r', linestyle='--', 
-                   label=f'Probabilidade Teórica (1/{self.faces})')
+        # (uma única soma acumulada; com janela definida, só os lançamentos retidos)
+        face_1_acumulada = self.contagem_acumulada(1)
+        n_retidos = len(face_1_acumulada)
+        probabilidades_face_1 = face_1_acumulada / np.arange(1, n_retidos + 1)
+        eixo_lancamentos = np.arange(n_lancamentos - n_retidos + 1, n_lancamentos + 1)
+        
+        ax2.plot(eixo_lancamentos, probabilidades_face_1, 'b-', alpha=0.7)
+        if self.honesto:
+            rotulo_teorico = f'Probabilidade Teórica (1/{self.faces})'
+        else:
+            rotulo_teorico = f'Probabilidade Teórica ({self.probabilidades[0]:.3f})'
+        ax2.axhline(y=self.probabilidades[0], color='r', linestyle='--', 
+                   label=rotulo_teorico)
         ax2.set_title('Convergência da Probabilidade Empírica (Face 1)')
         ax2.set_xlabel('Número de lançamentos')
         ax2.set_ylabel('Probabilidade da Face 1')
@@ -126,6 +312,94 @@ class Dado:
         
         return contagem
 
+# Tamanho (produto dos comprimentos) a partir do qual a convolução usa FFT
+_LIMIAR_FFT = 1 << 16
+_RUIDO_FFT = 8 * np.finfo(np.float64).eps
+
+def _convolver(a, b):
+    """
+    Convolução de duas distribuições: direta para vetores pequenos, via FFT para grandes
+    """
+    if len(a) * len(b) <= _LIMIAR_FFT:
+        return np.convolve(a, b)
+    
+    n = len(a) + len(b) - 1
+    tamanho_fft = 1 << (n - 1).bit_length()
+    resultado = np.fft.irfft(np.fft.rfft(a, tamanho_fft) * np.fft.rfft(b, tamanho_fft),
+                             tamanho_fft)[:n]
+    
+    # A FFT tem erro absoluto da ordem de eps * máximo em todas as posições:
+    # valores abaixo disso (inclusive os negativos) são ruído e viram zero
+    resultado[resultado < _RUIDO_FFT * resultado.max()] = 0
+    return resultado
+
+def _potencia_convolucao(pmf, k):
+    """
+    Distribuição da soma de k cópias independentes de pmf (exponenciação por quadrados)
+    """
+    resultado = np.ones(1)
+    base = np.asarray(pmf, dtype=np.float64)
+    while k > 0:
+        if k & 1:
+            resultado = _convolver(resultado, base)
+        k >>= 1
+        if k:
+            base = _convolver(base, base)
+    return resultado
+
+@lru_cache(maxsize=128)
+def _pmf_soma(configuracao):
+    """
+    Distribuição da soma para uma configuração ((probabilidades, quantidade), ...)
+    
+    O índice i do vetor corresponde à soma n_dados + i (cada face começa em 1).
+    O resultado fica em cache e é devolvido como array somente leitura.
+    """
+    pmf = np.ones(1)
+    for probabilidades, quantidade in configuracao:
+        pmf = _convolver(pmf, _potencia_convolucao(probabilidades, quantidade))
+    
+    pmf /= pmf.sum()
+    pmf.flags.writeable = False
+    return pmf
+
+def distribuicao_soma(dados):
+    """
+    Distribuição exata da soma de uma lista de dados (honestos ou viciados, de faces diferentes)
+    
+    Dados iguais são agrupados e elevados à potência por convolução; a
+    configuração resultante é a chave do cache LRU. Retorna
+    (somas, probabilidades) como arrays NumPy.
+    
+    Para distribuições pequenas a convolução é direta e o erro é só de
+    arredondamento relativo. Nas grandes (via FFT) o erro é absoluto, de
+    cerca de 1e-15 vezes a maior probabilidade; somas com probabilidade
+    abaixo disso aparecem como 0.
+    """
+    grupos = Counter(dado.configuracao for dado in dados)
+    configuracao = tuple(sorted(grupos.items()))
+    pmf = _pmf_soma(configuracao)
+    
+    n_dados = sum(grupos.values())
+    somas = np.arange(n_dados, n_dados + len(pmf))
+    return somas, pmf
+
+def probabilidade_soma(dados, minimo=None, maximo=None):
+    """
+    Probabilidade exata de minimo <= soma <= maximo para uma lista de dados
+    
+    Mesma precisão de distribuicao_soma: com muitos dados, eventos com
+    probabilidade menor que cerca de 1e-15 vezes a da soma mais provável
+    resultam em 0.
+    """
+    somas, pmf = distribuicao_soma(dados)
+    selecao = np.ones(len(somas), dtype=bool)
+    if minimo is not None:
+        selecao &= somas >= minimo
+    if maximo is not None:
+        selecao &= somas <= maximo
+    return float(pmf[selecao].sum())
+
 def demonstrar_eventos():
     """
     Demonstra diferentes tipos de eventos com um dado
@@ -220,8 +494,8 @@ def demonstrar_dois_dados():
         prob_empirica = freq / n_lancamentos
         print(f"   Soma {soma}: {freq} ocorrências (P = {prob_empirica:.3f})")
     
-    # Probabilidade teórica da soma 7
-    prob_teorica_7 = 6 / 36  # Há 6 maneiras de obter soma 7
+    # Probabilidade teórica da soma 7 (distribuição exata por convolução)
+    prob_teorica_7 = dado1.probabilidade_soma(2, minimo=7, maximo=7)  # 6/36
     prob_empirica_7 = contagem_somas[7] / n_lancamentos
     print(f"\n4. ANÁLISE DA SOMA 7:")
     print(f"   P(soma = 7) teórica = {prob_teorica_7:.3f}")
@@ -0,0 +1,245 @@
+"""
+Histórico de resultados com memória limitada
+Guarda os resultados de um experimento aleatório (moeda, dado, ...) de forma compacta
+
+Desenvolvido por: Thiago Rodrigues Pantoja
+Empresa: EasyNext Informática LTDA
+Emails: thiago.pantoja@easynext.tech | thiago.pantoja@easynext.consulting
+Telefones: (11) 98801-0667 | (92) 98456-1928
+Data: Setembro 2025
+"""
+
+import numpy as np
+
+def _trechos(inicio, fim, capacidade):
+    """
+    Divide as posições absolutas [inicio, fim) em trechos contíguos de um buffer
+    
+    Com capacidade=None o buffer é linear; caso contrário é circular e o
+    intervalo (de tamanho no máximo igual à capacidade) pode dar a volta.
+    Retorna tuplas (inicio_no_buffer, fim_no_buffer, deslocamento).
+    """
+    if capacidade is None:
+        return [(inicio, fim, 0)]
+    
+    tamanho = fim - inicio
+    a = inicio % capacidade
+    primeiro = min(tamanho, capacidade - a)
+    trechos = [(a, a + primeiro, 0)]
+    if primeiro < tamanho:
+        trechos.append((0, tamanho - primeiro, primeiro))
+    return trechos
+
+class HistoricoAmostral:
+    """
+    Histórico de resultados codificados como inteiros 0..n_resultados-1
+    
+    - contagens: contagem exata de cada resultado desde o início (sempre mantida)
+    - janela=None guarda todos os códigos; janela=W guarda só os últimos W
+      num buffer circular pré-alocado
+    - tamanho_amostra=k mantém uma amostra por reservatório (uniforme sobre
+      todos os resultados já registrados) com k códigos
+    
+    Contagens em janelas usam índices de contagens acumuladas por resultado,
+    criados sob demanda e estendidos de forma preguiçosa, então cada
+    consulta custa O(1). Com janela definida, a memória é fixa
+    independentemente do número de resultados registrados.
+    """
+    
+    def __init__(self, n_resultados, janela=None, tamanho_amostra=0, rng=None):
+        if janela is not None and janela < 1:
+            raise ValueError("A janela deve ter pelo menos 1 resultado")
+        if tamanho_amostra < 0:
+            raise ValueError("O tamanho da amostra deve ser não negativo")
+        
+        self.n_resultados = n_resultados
+        self.janela = janela
+        self.tamanho_amostra = tamanho_amostra
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.dtype = np.min_scalar_type(max(n_resultados - 1, 0))
+        self.limpar()
+    
+    def limpar(self):
+        """
+        Descarta todos os resultados registrados
+        """
+        self.n_total = 0
+        self.contagens = np.zeros(self.n_resultados, dtype=np.int64)
+        
+        capacidade = 0 if self.janela is None else self.janela
+        self._buffer = np.empty(capacidade, dtype=self.dtype)
+        
+        # codigo -> (contagens acumuladas, posição até onde o índice está atualizado)
+        self._prefixos = {}
+        
+        self._reservatorio = np.empty(self.tamanho_amostra, dtype=self.dtype)
+        self._peso_reservatorio = 0.0
+        self._proxima_troca = 0
+    
+    @property
+    def n_retidos(self):
+        """
+        Número de resultados ainda disponíveis no buffer
+        """
+        if self.janela is None:
+            return self.n_total
+        return min(self.n_total, self.janela)
+    
+    @property
+    def codigos(self):
+        """
+        Resultados retidos, em ordem cronológica
+        """
+        return self._codigos_entre(self.n_total - self.n_retidos, self.n_total)
+    
+    @property
+    def amostra(self):
+        """
+        Amostra por reservatório (vazia se tamanho_amostra=0)
+        """
+        return self._reservatorio[:min(self.n_total, self.tamanho_amostra)].copy()
+    
+    def _codigos_entre(self, inicio, fim):
+        """
+        Códigos nas posições absolutas [inicio, fim), que precisam estar retidas
+        """
+        if self.janela is None:
+            return self._buffer[inicio:fim]
+        
+        partes = [self._buffer[a:b] for a, b, _ in _trechos(inicio, fim, self.janela)]
+        return np.concatenate(partes) if len(partes) > 1 else partes[0].copy()
+    
+    def registrar(self, codigos):
+        """
+        Acrescenta um lote de códigos ao histórico
+        """
+        codigos = np.asarray(codigos, dtype=self.dtype).ravel()
+        n = len(codigos)
+        if n == 0:
+            return
+        
+        self.contagens += np.bincount(codigos, minlength=self.n_resultados)
+        if self.tamanho_amostra > 0:
+            self._atualizar_reservatorio(codigos)
+        
+        inicio = self.n_total
+        if self.janela is None:
+            fim = inicio + n
+            if fim > len(self._buffer):
+                novo = np.empty(max(fim, 2 * len(self._buffer)), dtype=self.dtype)
+                novo[:inicio] = self._buffer[:inicio]
+                self._buffer = novo
+            self._buffer[inicio:fim] = codigos
+        else:
+            # Só os últimos W códigos do lote sobrevivem no buffer circular
+            if n > self.janela:
+                inicio += n - self.janela
+                codigos = codigos[-self.janela:]
+            for a, b, deslocamento in _trechos(inicio, inicio + len(codigos), self.janela):
+                self._buffer[a:b] = codigos[deslocamento:deslocamento + b - a]
+        
+        self.n_total += n
+    
+    def _atualizar_reservatorio(self, codigos):
+        """
+        Amostragem por reservatório (Algoritmo L de Li)
+        
+        Em vez de sortear um número por resultado, sorteia o tamanho do salto
+        até a próxima substituição; o custo por lote é proporcional ao número
+        de substituições, O(k log(n/k)) no total.
+        """
+        k = self.tamanho_amostra
+        inicio = self.n_total
+        fim = inicio + len(codigos)
+        
+        # Enche o reservatório com os primeiros k resultados
+        if inicio < k:
+            cheios = min(k, fim) - inicio
+            self._reservatorio[inicio:inicio + cheios] = codigos[:cheios]
+            if inicio + cheios < k:
+                return
+            self._peso_reservatorio = np.exp(np.log(1 - self.rng.random()) / k)
+            self._proxima_troca = k - 1 + self._salto()
+        
+        while self._proxima_troca < fim:
+            posicao = self._proxima_troca - inicio
+            self._reservatorio[self.rng.integers(k)] = codigos[posicao]
+            self._peso_reservatorio *= np.exp(np.log(1 - self.rng.random()) / k)
+            self._proxima_troca += self._salto()
+    
+    def _salto(self):
+        """
+        Distância (geométrica) até o próximo resultado que entra no reservatório
+        """
+        u = 1 - self.rng.random()
+        return int(np.floor(np.log(u) / np.log1p(-self._peso_reservatorio))) + 1
+    
+    def _atualizar_prefixo(self, codigo):
+        """
+        Estende o índice de contagens acumuladas de um resultado até a última posição
+        
+        prefixo[posição] guarda quantas vezes o código apareceu antes daquela
+        posição absoluta (a menos de uma constante, no modo circular).
+        """
+        capacidade = None if self.janela is None else self.janela + 1
+        inicio_retido = self.n_total - self.n_retidos
+        
+        if codigo in self._prefixos:
+            prefixo, indexado = self._prefixos[codigo]
+        else:
+            prefixo = np.zeros(1 if capacidade is None else capacidade, dtype=np.int64)
+            indexado = inicio_retido
+        
+        # Resultados que saíram da janela antes de serem indexados: recomeça a base
+        if indexado < inicio_retido:
+            indexado = inicio_retido
+            prefixo[indexado % capacidade] = 0
+        
+        fim = self.n_total
+        if indexado < fim:
+            if capacidade is None and len(prefixo) < fim + 1:
+                novo = np.empty(max(fim + 1, 2 * len(prefixo)), dtype=np.int64)
+                novo[:indexado + 1] = prefixo[:indexado + 1]
+                prefixo = novo
+            
+            base = prefixo[indexado if capacidade is None else indexado % capacidade]
+            acumulado = np.cumsum(self._codigos_entre(indexado, fim) == codigo, dtype=np.int64)
+            acumulado += base
+            for a, b, deslocamento in _trechos(indexado + 1, fim + 1, capacidade):
+                prefixo[a:b] = acumulado[deslocamento:deslocamento + b - a]
+        
+        self._prefixos[codigo] = (prefixo, fim)
+        return prefixo
+    
+    def _valor_prefixo(self, prefixo, posicao):
+        if self.janela is None:
+            return prefixo[posicao]
+        return prefixo[posicao % (self.janela + 1)]
+    
+    def contagem_recente(self, codigo, n):
+        """
+        Quantas vezes o código apareceu nos últimos n resultados, em O(1)
+        """
+        if n > self.n_retidos:
+            raise ValueError(
+                f"Só os últimos {self.n_retidos} resultados estão disponíveis (pedido: {n})")
+        
+        prefixo = self._atualizar_prefixo(codigo)
+        return int(self._valor_prefixo(prefixo, self.n_total)
+                   - self._valor_prefixo(prefixo, self.n_total - n))
+    
+    def contagem_acumulada(self, codigo):
+        """
+        Contagem do código após cada resultado retido (a partir do mais antigo retido)
+        """
+        prefixo = self._atualizar_prefixo(codigo)
+        inicio = self.n_total - self.n_retidos
+        
+        if self.janela is None:
+            valores = prefixo[inicio + 1:self.n_total + 1]
+        else:
+            partes = [prefixo[a:b]
+                      for a, b, _ in _trechos(inicio + 1, self.n_total + 1, self.janela + 1)]
+            valores = np.concatenate(partes)
+        
+        return valores - self._valor_prefixo(prefixo, inicio)
@@ -9,35 +9,142 @@ Telefones: (11) 98801-0667 | (92) 98456-1928
 Data: Setembro 2025
 """
 
-import random
+import os
+import sys
+import numpy as np
 import matplotlib.pyplot as plt
 from collections import Counter
 
+# Permite importar os módulos do repositório também ao executar este arquivo diretamente
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from exemplos_basicos.historico import HistoricoAmostral
+
 class Moeda:
     """
     Classe que representa uma moeda e suas operações probabilísticas
+    
+    O histórico é guardado de forma compacta como códigos uint8
+    (0 = cara, 1 = coroa), ocupando 1 byte por lançamento. Os rótulos
+    'cara'/'coroa' só são gerados quando o histórico é lido.
+    
+    janela: se definida, guarda só os últimos lançamentos num buffer
+    circular (memória fixa); as contagens totais continuam exatas.
+    tamanho_amostra: mantém uma amostra uniforme (por reservatório)
+    de todos os lançamentos já feitos.
     """
     
-    def __init__(self):
+    def __init__(self, semente=None, janela=None, tamanho_amostra=0):
         self.espaco_amostral = ['cara', 'coroa']
-        self.historico = []
+        self.rng = np.random.default_rng(semente)
+        self._historico = HistoricoAmostral(len(self.espaco_amostral), janela,
+                                            tamanho_amostra, self.rng)
+    
+    @property
+    def codigos(self):
+        """
+        Histórico compacto (códigos uint8 dos lançamentos retidos)
+        """
+        codigos = self._historico.codigos
+        codigos.flags.writeable = False
+        return codigos
+    
+    @property
+    def historico(self):
+        """
+        Histórico decodificado em rótulos ('cara'/'coroa')
+        """
+        return self.decodificar(self.codigos)
+    
+    @historico.setter
+    def historico(self, resultados):
+        self.limpar_historico()
+        self._historico.registrar(self.codificar(resultados))
+    
+    @property
+    def n_lancamentos(self):
+        """
+        Número total de lançamentos feitos desde a última limpeza
+        """
+        return self._historico.n_total
+    
+    @property
+    def contagens(self):
+        """
+        Contagem exata de cada resultado em todos os lançamentos
+        """
+        return dict(zip(self.espaco_amostral, self._historico.contagens.tolist()))
+    
+    @property
+    def amostra(self):
+        """
+        Amostra uniforme dos lançamentos (requer tamanho_amostra > 0)
+        """
+        return self.decodificar(self._historico.amostra)
+    
+    def limpar_historico(self):
+        """
+        Descarta todos os lançamentos registrados
+        """
+        self._historico.limpar()
+    
+    def codificar(self, resultados):
+        """
+        Converte rótulos ('cara'/'coroa') em códigos uint8
+        """
+        codigos = [self.espaco_amostral.index(resultado) for resultado in resultados]
+        return np.asarray(codigos, dtype=np.uint8)
+    
+    def decodificar(self, codigos):
+        """
+        Converte códigos uint8 em rótulos ('cara'/'coroa')
+        """
+        return np.asarray(self.espaco_amostral)[np.asarray(codigos)].tolist()
+    
+    def contagem_recente(self, evento='cara', n_lancamentos=None):
+        """
+        Conta as ocorrências do evento nos últimos n_lancamentos em O(1)
+        """
+        if n_lancamentos is None:
+            n_lancamentos = self._historico.n_retidos
+        
+        codigo = self.espaco_amostral.index(evento)
+        return self._historico.contagem_recente(codigo, n_lancamentos)
+    
+    def contagem_acumulada(self, evento='cara'):
+        """
+        Retorna o número de ocorrências do evento após cada lançamento retido
+        """
+        return self._historico.contagem_acumulada(self.espaco_amostral.index(evento))
     
     def lancar(self):
         """
         Lança a moeda e retorna o resultado
         """
-        resultado = random.choice(self.espaco_amostral)
-        self.historico.append(resultado)
-        return resultado
+        codigo = int(self.rng.integers(2))
+        self._historico.registrar([codigo])
+        return self.espaco_amostral[codigo]
+    
+    def lancar_lote(self, n):
+        """
+        Lança a moeda n vezes de uma só vez e retorna os códigos uint8
+        
+        Cada byte aleatório do gerador rende 8 lançamentos (um por bit),
+        então não há laço em Python nem strings intermediárias.
+        """
+        if n < 0:
+            raise ValueError("O número de lançamentos deve ser não negativo")
+        
+        bytes_aleatorios = self.rng.integers(0, 256, size=(n + 7) // 8, dtype=np.uint8)
+        codigos = np.unpackbits(bytes_aleatorios, count=n)
+        self._historico.registrar(codigos)
+        return codigos
     
     def lancar_multiplas_vezes(self, n):
         """
         Lança a moeda n vezes e retorna os resultados
         """
-        resultados = []
-        for _ in range(n):
-            resultados.append(self.lancar())
-        return resultados
+        return self.decodificar(self.lancar_lote(n))
     
     def probabilidade_cara(self):
         """
@@ -56,27 +163,36 @@ class Moeda:
         Calcula a probabilidade empírica baseada no histórico
         """
         if n_lancamentos is None:
-            n_lancamentos = len(self.historico)
+            if self.n_lancamentos == 0:
+                return 0
+            
+            # Todos os lançamentos: usa as contagens exatas
+            return self.contagens.get(evento, 0) / self.n_lancamentos
         
         if n_lancamentos == 0:
             return 0
         
-        # Usa apenas os últimos n_lancamentos
-        historico_recente = self.historico[-n_lancamentos:]
-        contagem = Counter(historico_recente)
+        # Eventos fora do espaço amostral nunca ocorrem, como em Dado
+        if evento not in self.espaco_amostral:
+            return 0.0
         
-        return contagem[evento] / n_lancamentos
+        # Usa apenas os últimos n_lancamentos
+        n_disponiveis = min(n_lancamentos, self.n_lancamentos)
+        return self.contagem_recente(evento, n_disponiveis) / n_lancamentos
     
     def plotar_resultados(self, n_lancamentos=1000):
         """
         Plota os resultados de múltiplos lançamentos
         """
         # Limpa o histórico e faz novos lançamentos
-        self.historico = []
-        resultados = self.lancar_multiplas_vezes(n_lancamentos)
+        self.limpar_historico()
+        codigos = self.lancar_lote(n_lancamentos)
         
-        # Conta os resultados
-        contagem = Counter(resultados)
+        # Conta os resultados diretamente sobre os códigos
+        frequencias = np.bincount(codigos, minlength=len(self.espaco_amostral))
+        contagem = Counter({evento: int(freq)
+                            for evento, freq in zip(self.espaco_amostral, frequencias)
+                            if freq > 0})
         
         # Cria o gráfico
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
@@ -96,12 +212,14 @@ class Moeda:
             ax1.text(i, v + 0.01, str(v), ha='center', va='bottom')
         
         # Gráfico de probabilidade empírica ao longo do tempo
-        probabilidades_cara = []
-        for i in range(1, n_lancamentos + 1):
-            prob = self.probabilidade_empirica('cara', i)
-            probabilidades_cara.append(prob)
+        # (uma única soma acumulada em vez de uma contagem por ponto; com
+        # janela definida, a curva cobre apenas os lançamentos retidos)
+        caras_acumuladas = self.contagem_acumulada('cara')
+        n_retidos = len(caras_acumuladas)
+        probabilidades_cara = caras_acumuladas / np.arange(1, n_retidos + 1)
+        eixo_lancamentos = np.arange(n_lancamentos - n_retidos + 1, n_lancamentos + 1)
         
-        ax2.plot(range(1, n_lancamentos + 1), probabilidades_cara, 'b-', alpha=0.7)
+        ax2.plot(eixo_lancamentos, probabilidades_cara, 'b-', alpha=0.7)
         ax2.axhline(y=0.5, color='r', linestyle='--', label='Probabilidade Teórica (0.5)')
         ax2.set_title('Convergência da Probabilidade Empírica')
         ax2.set_xlabel('Número de lançamentos')
@@ -146,7 +264,7 @@ def demonstrar_conceitos():
     
     print("\n5. SIMULAÇÃO COM MAIS LANÇAMENTOS:")
     n_grande = 1000
-    moeda.historico = []  # Limpa o histórico
+    moeda.limpar_historico()
     resultados_grandes = moeda.lancar_multiplas_vezes(n_grande)
     contagem_grande = Counter(resultados_grandes)
     
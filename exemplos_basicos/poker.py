@@ -0,0 +1,292 @@
+"""
+Exemplo básico: Mãos de Pôquer
+Avalia mãos de 5 a 7 cartas em lote e estima probabilidades por Monte Carlo
+
+Desenvolvido por: Thiago Rodrigues Pantoja
+Empresa: EasyNext Informática LTDA
+Emails: thiago.pantoja@easynext.tech | thiago.pantoja@easynext.consulting
+Telefones: (11) 98801-0667 | (92) 98456-1928
+Data: Setembro 2025
+"""
+
+import os
+import sys
+import numpy as np
+from functools import lru_cache
+from math import comb
+
+# Permite importar os módulos do repositório também ao executar este arquivo diretamente
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from exemplos_basicos.baralho import Baralho
+
+CATEGORIAS = ['carta alta', 'par', 'dois pares', 'trinca', 'sequência',
+              'flush', 'full house', 'quadra', 'straight flush']
+
+# Número de mãos de 5 cartas em cada categoria (de um total de C(52, 5))
+MAOS_POR_CATEGORIA_5_CARTAS = [1302540, 1098240, 123552, 54912, 10200,
+                               5108, 3744, 624, 40]
+
+# Os códigos de carta seguem o Baralho: naipe * 13 + índice do valor,
+# com valores na ordem A, 2, ..., K. No pôquer o Ás é a carta mais alta,
+# então o valor de pôquer vai de 0 (2) a 12 (Ás).
+_VALOR_POQUER = np.array([(codigo % 13 - 1) % 13 for codigo in range(52)], dtype=np.int64)
+_NAIPE = np.array([codigo // 13 for codigo in range(52)], dtype=np.int64)
+
+# Chave de uma mão: contagem de cada valor escrita em base 5
+_POTENCIAS_5 = 5 ** np.arange(13, dtype=np.int64)
+
+def _pontuacao(categoria, desempate):
+    """
+    Pontuação inteira: maior pontuação = mão mais forte
+    """
+    pontos = categoria
+    for i in range(5):
+        pontos = pontos * 13 + (desempate[i] if i < len(desempate) else 0)
+    return pontos
+
+def _sequencia_mais_alta(mascara):
+    """
+    Valor mais alto de uma sequência contida na máscara de 13 bits (-1 se não houver)
+    """
+    for topo in range(12, 3, -1):
+        padrao = 0b11111 << (topo - 4)
+        if mascara & padrao == padrao:
+            return topo
+    
+    # A-2-3-4-5: o Ás (bit 12) vale como carta mais baixa
+    roda = (1 << 12) | 0b1111
+    if mascara & roda == roda:
+        return 3
+    return -1
+
+@lru_cache(maxsize=None)
+def _tabela_flush():
+    """
+    Pontuação de flush/straight flush para cada máscara de 13 bits de um naipe
+    """
+    tabela = np.zeros(1 << 13, dtype=np.int64)
+    for mascara in range(1 << 13):
+        valores = [v for v in range(12, -1, -1) if mascara >> v & 1]
+        if len(valores) < 5:
+            continue
+        
+        topo = _sequencia_mais_alta(mascara)
+        if topo >= 0:
+            tabela[mascara] = _pontuacao(8, [topo])
+        else:
+            tabela[mascara] = _pontuacao(5, valores[:5])
+    return tabela
+
+def _pontuacao_por_contagens(contagens):
+    """
+    Melhor mão (sem flush) dadas as contagens de cada valor
+    """
+    por_contagem = {n: [v for v in range(12, -1, -1) if contagens[v] == n] for n in (1, 2, 3, 4)}
+    presentes = [v for v in range(12, -1, -1) if contagens[v] > 0]
+    mascara = sum(1 << v for v in presentes)
+    
+    def maiores_exceto(excluidos, n):
+        return [v for v in presentes if v not in excluidos][:n]
+    
+    quadras, trincas, pares = por_contagem[4], por_contagem[3], por_contagem[2]
+    if quadras:
+        return _pontuacao(7, [quadras[0]] + maiores_exceto(quadras[:1], 1))
+    
+    if trincas and (len(trincas) > 1 or pares):
+        return _pontuacao(6, [trincas[0], max(trincas[1:] + pares)])
+    
+    topo = _sequencia_mais_alta(mascara)
+    if topo >= 0:
+        return _pontuacao(4, [topo])
+    
+    if trincas:
+        return _pontuacao(3, [trincas[0]] + maiores_exceto(trincas[:1], 2))
+    
+    if len(pares) >= 2:
+        return _pontuacao(2, pares[:2] + maiores_exceto(pares[:2], 1))
+    
+    if pares:
+        return _pontuacao(1, pares[:1] + maiores_exceto(pares[:1], 3))
+    
+    return _pontuacao(0, presentes[:5])
+
+@lru_cache(maxsize=None)
+def _tabela_valores():
+    """
+    Tabela ordenada (chave, pontuação) para toda combinação de valores de 5 a 7 cartas
+    
+    A chave é a contagem de cada valor em base 5; a busca é feita com
+    np.searchsorted sobre as chaves ordenadas.
+    """
+    chaves = []
+    pontos = []
+    contagens = [0] * 13
+    
+    def preencher(valor, restantes):
+        if valor == 13:
+            if 7 - restantes >= 5:
+                chaves.append(sum(c * 5 ** v for v, c in enumerate(contagens)))
+                pontos.append(_pontuacao_por_contagens(contagens))
+            return
+        for c in range(min(4, restantes) + 1):
+            contagens[valor] = c
+            preencher(valor + 1, restantes - c)
+        contagens[valor] = 0
+    
+    preencher(0, 7)
+    
+    chaves = np.array(chaves, dtype=np.int64)
+    pontos = np.array(pontos, dtype=np.int64)
+    ordem = np.argsort(chaves)
+    return chaves[ordem], pontos[ordem]
+
+def avaliar_maos(maos, tamanho_bloco=1 << 20):
+    """
+    Pontua um lote de mãos de 5, 6 ou 7 cartas
+    
+    maos: matriz (n_maos, n_cartas) de códigos de carta (0–51).
+    Retorna um array com a pontuação da melhor mão de 5 cartas de cada
+    linha; maior pontuação = mão mais forte, empate = mesma força.
+    Tudo é feito por contagens e consultas a tabelas pré-calculadas,
+    processando até tamanho_bloco mãos por vez.
+    """
+    maos = np.asarray(maos)
+    if maos.ndim != 2 or not 5 <= maos.shape[1] <= 7:
+        raise ValueError("As mãos devem ser uma matriz com 5 a 7 cartas por linha")
+    
+    chaves_tabela, pontos_tabela = _tabela_valores()
+    tabela_flush = _tabela_flush()
+    
+    pontos = np.empty(len(maos), dtype=np.int64)
+    for inicio in range(0, len(maos), tamanho_bloco):
+        bloco = maos[inicio:inicio + tamanho_bloco].astype(np.intp)
+        n_maos = len(bloco)
+        valores = _VALOR_POQUER[bloco]
+        naipes = _NAIPE[bloco]
+        linhas = np.arange(n_maos)[:, None]
+        
+        # Mãos sem flush: contagem de cada valor -> chave -> tabela
+        contagens = np.bincount((linhas * 13 + valores).ravel(),
+                                minlength=n_maos * 13).reshape(n_maos, 13)
+        pontos_bloco = pontos_tabela[np.searchsorted(chaves_tabela, contagens @ _POTENCIAS_5)]
+        
+        # Mãos com 5+ cartas do mesmo naipe: máscara dos valores desse naipe -> tabela
+        contagens_naipes = np.bincount((linhas * 4 + naipes).ravel(),
+                                       minlength=n_maos * 4).reshape(n_maos, 4)
+        com_flush = np.flatnonzero(contagens_naipes.max(axis=1) >= 5)
+        if len(com_flush) > 0:
+            naipe_flush = contagens_naipes[com_flush].argmax(axis=1)
+            no_naipe = naipes[com_flush] == naipe_flush[:, None]
+            mascaras = np.where(no_naipe, 1 << valores[com_flush], 0).sum(axis=1)
+            pontos_bloco[com_flush] = np.maximum(pontos_bloco[com_flush], tabela_flush[mascaras])
+        
+        pontos[inicio:inicio + n_maos] = pontos_bloco
+    
+    return pontos
+
+def categorias(pontos):
+    """
+    Índice da categoria (posição em CATEGORIAS) de cada pontuação
+    """
+    return np.asarray(pontos) // 13 ** 5
+
+def avaliar_mao(cartas, baralho=None):
+    """
+    Avalia uma única mão dada como lista de cartas (valor, naipe)
+    
+    Retorna (nome da categoria, pontuação).
+    """
+    baralho = baralho if baralho is not None else Baralho()
+    codigos = [[baralho.codificar_carta(carta) for carta in cartas]]
+    pontos = int(avaliar_maos(codigos)[0])
+    return CATEGORIAS[pontos // 13 ** 5], pontos
+
+def estimar_equidade(mao, mesa=(), n_oponentes=1, n_simulacoes=100000,
+                     baralho=None, tamanho_bloco=1 << 18):
+    """
+    Estima por Monte Carlo a equidade de uma mão de Texas Hold'em
+    
+    mao: as 2 cartas do jogador; mesa: 0 a 5 cartas comunitárias já
+    conhecidas. As cartas que faltam (mesa e mãos dos oponentes) são
+    sacadas em lote das cartas restantes, e todas as mãos de 7 cartas são
+    avaliadas de uma vez. Retorna as probabilidades de vitória, empate
+    e derrota e a equidade (empates divididos entre os empatados).
+    """
+    baralho = baralho if baralho is not None else Baralho()
+    conhecidas = [baralho.codificar_carta(carta) for carta in list(mao) + list(mesa)]
+    restantes = np.setdiff1d(np.arange(len(baralho.cartas)), conhecidas)
+    
+    faltam_mesa = 5 - len(mesa)
+    n_sacadas = faltam_mesa + 2 * n_oponentes
+    if n_sacadas > len(restantes):
+        raise ValueError("Não há cartas suficientes para tantos oponentes")
+    
+    vitorias = empates = derrotas = 0
+    equidade = 0.0
+    for inicio in range(0, n_simulacoes, tamanho_bloco):
+        n = min(tamanho_bloco, n_simulacoes - inicio)
+        sacadas = baralho.sacar_lote(n, n_sacadas, cartas=restantes)
+        
+        mesa_completa = np.hstack([np.tile(conhecidas[2:], (n, 1)), sacadas[:, :faltam_mesa]])
+        pontos_jogador = avaliar_maos(np.hstack([np.tile(conhecidas[:2], (n, 1)), mesa_completa]))
+        
+        pontos_oponentes = np.empty((n, n_oponentes), dtype=np.int64)
+        for o in range(n_oponentes):
+            cartas_oponente = sacadas[:, faltam_mesa + 2 * o:faltam_mesa + 2 * o + 2]
+            pontos_oponentes[:, o] = avaliar_maos(np.hstack([cartas_oponente, mesa_completa]))
+        
+        melhor_oponente = pontos_oponentes.max(axis=1)
+        venceu = pontos_jogador > melhor_oponente
+        empatou = pontos_jogador == melhor_oponente
+        n_empatados = (pontos_oponentes == pontos_jogador[:, None]).sum(axis=1)
+        
+        vitorias += np.count_nonzero(venceu)
+        empates += np.count_nonzero(empatou)
+        derrotas += n - np.count_nonzero(venceu) - np.count_nonzero(empatou)
+        equidade += np.count_nonzero(venceu) + np.sum(1 / (n_empatados[empatou] + 1))
+    
+    return {
+        'vitoria': vitorias / n_simulacoes,
+        'empate': empates / n_simulacoes,
+        'derrota': derrotas / n_simulacoes,
+        'equidade': equidade / n_simulacoes,
+    }
+
+def demonstrar_poker():
+    """
+    Compara frequências simuladas das mãos de pôquer com as teóricas
+    """
+    print("=== DEMONSTRAÇÃO: MÃOS DE PÔQUER ===\n")
+    
+    baralho = Baralho()
+    
+    print("1. AVALIAÇÃO DE UMA MÃO:")
+    mao = [('A', 'copas'), ('A', 'espadas'), ('K', 'ouros'), ('K', 'paus'), ('K', 'copas')]
+    categoria, pontos = avaliar_mao(mao, baralho)
+    print(f"   Mão: {mao}")
+    print(f"   Categoria: {categoria} (pontuação {pontos})")
+    
+    print("\n2. FREQUÊNCIAS EM MÃOS DE 5 CARTAS:")
+    n_maos = 1_000_000
+    maos = baralho.sacar_lote(n_maos, 5)
+    frequencias = np.bincount(categorias(avaliar_maos(maos)), minlength=len(CATEGORIAS))
+    total = comb(52, 5)
+    
+    print("   Categoria      | Simulada  | Teórica")
+    print("   ---------------|-----------|----------")
+    for nome, freq, casos in zip(CATEGORIAS, frequencias, MAOS_POR_CATEGORIA_5_CARTAS):
+        print(f"   {nome:14s} | {freq / n_maos:.6f}  | {casos / total:.6f}")
+    
+    print("\n3. EQUIDADE NO TEXAS HOLD'EM (par de Áses contra 1 oponente):")
+    resultado = estimar_equidade([('A', 'copas'), ('A', 'espadas')], n_oponentes=1,
+                                 n_simulacoes=200000, baralho=baralho)
+    print(f"   Vitória: {resultado['vitoria']:.3f}")
+    print(f"   Empate: {resultado['empate']:.3f}")
+    print(f"   Equidade: {resultado['equidade']:.3f}")
+    
+    return frequencias, resultado
+
+if __name__ == "__main__":
+    # Executa a demonstração
+    frequencias, resultado = demonstrar_poker()
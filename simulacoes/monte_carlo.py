@@ -19,21 +19,31 @@ class SimulacaoMonteCarlo:
     Classe para realizar simulações Monte Carlo
     """
     
-    def __init__(self, n_simulacoes=10000):
+    def __init__(self, n_simulacoes=10000, semente=None):
         self.n_simulacoes = n_simulacoes
         self.resultados = []
+        self.rng = np.random.default_rng(semente)
     
-    def simular_lancamento_dados(self, n_dados=2, n_lancamentos=1):
+    def simular_lancamento_dados(self, n_dados=2, n_lancamentos=1, faces=6, max_elementos=1 << 24):
         """
         Simula lançamento de dados
+        
+        Retorna um array (n_simulacoes, n_lancamentos) com a soma dos n_dados
+        de cada lançamento. Os dados são sorteados de uma vez, como um array
+        (simulações, lançamentos, dados), dividido em blocos de simulações
+        quando passaria de max_elementos valores.
         """
-        resultados = []
-        for _ in range(self.n_simulacoes):
-            lancamentos = []
-            for _ in range(n_lancamentos):
-                soma = sum(random.randint(1, 6) for _ in range(n_dados))
-                lancamentos.append(soma)
-            resultados.append(lancamentos)
+        tipo_dado = np.uint8 if faces < 256 else np.int64
+        tipo_soma = np.int16 if n_dados * faces < 2 ** 15 else np.int64
+        resultados = np.empty((self.n_simulacoes, n_lancamentos), dtype=tipo_soma)
+        
+        tamanho_bloco = max(1, max_elementos // max(1, n_lancamentos * n_dados))
+        for inicio in range(0, self.n_simulacoes, tamanho_bloco):
+            fim = min(inicio + tamanho_bloco, self.n_simulacoes)
+            dados = self.rng.integers(1, faces + 1, size=(fim - inicio, n_lancamentos, n_dados),
+                                      dtype=tipo_dado)
+            dados.sum(axis=2, dtype=tipo_soma, out=resultados[inicio:fim])
+        
         return resultados
     
     def simular_probabilidade_soma(self, soma_desejada, n_dados=2):
@@ -125,7 +135,7 @@ def exemplo_soma_dados():
     
     # Simula múltiplas somas
     resultados = simulador.simular_lancamento_dados(n_dados=2, n_lancamentos=1)
-    somas = [resultado[0] for resultado in resultados]
+    somas = resultados[:, 0]
     
     # Conta frequências
     frequencias = {}